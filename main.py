@@ -1,6 +1,9 @@
 import os
 import logging
 import sys
+import time
+import click
+from datetime import datetime, timedelta
 from flask import Flask, jsonify, request
 from src.config import DevelopmentConfig, config as config_map
 from src.models.database import db
@@ -11,6 +14,23 @@ from livekit import api
 from dotenv import load_dotenv
 from src.models.database import VisitorLog
 from src.route.admin_route.admin import admin_bp
+from src.utils.write_behind import analytics_writer
+from src.utils.geoip import geo_resolver
+from src.utils.blog_cache import blog_page_cache
+from src.utils.sitemap import sitemap_builder
+from src.utils.prerender import prerendered_pages
+from src.utils.compression import init_compression, precompress_static
+from src.utils.static_assets import static_manifest
+from src.utils.image_variants import image_variants
+from src.utils.upload_store import collect_garbage
+from src.utils.view_counter import view_counter
+from src.utils.admin_identity import admin_identities
+from src.utils.dashboard_counters import dashboard_counters
+from src.utils.read_tracker import read_heartbeats
+from src.utils.reader_sketches import reader_sketches, rebuild_reader_sketches
+from src.utils.geo_enrich import ENRICHABLE_MODELS, enrich_geo
+from src.utils.rollup import rollup_visitors
+from src.utils.exports import EXPORT_FORMATS, EXPORTS, iter_export
 
 
 logging.basicConfig(
@@ -30,6 +50,16 @@ load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
 # Initialize database properly
 db.init_app(app)
 migrate = Migrate(app, db)
+analytics_writer.init_app(app)
+geo_resolver.init_app(app)
+blog_page_cache.init_app(app)
+sitemap_builder.init_app(app)
+prerendered_pages.init_app(app)
+view_counter.init_app(app)
+read_heartbeats.init_app(app)
+reader_sketches.init_app(app)
+admin_identities.init_app(app)
+dashboard_counters.init_app(app)
 
 # Register Blueprints
 app.register_blueprint(home_bp)
@@ -37,15 +67,27 @@ app.register_blueprint(agent_bp)
 
 app.register_blueprint(admin_bp)
 
+# Fingerprinted static URLs (static_url() in templates) and prebuilt .br/.gz siblings
+static_manifest.init_app(app)
+# Responsive WebP/AVIF variants of blog uploads (image_sources() / responsive_images)
+image_variants.init_app(app)
+# gzip/brotli for dynamic responses
+init_compression(app)
+
+
+# Analytics beacons are not page views.
+BEACON_ENDPOINTS = {"home.collect_events", "home.blog_detail_track_public", "admin.track_blog_read"}
+
 
 @app.before_request
 def log_visitor():
     if request.endpoint in ("static", None) or request.path in ("/favicon.ico", "/robots.txt"):
         return
+    if request.endpoint in BEACON_ENDPOINTS or app.config.get("VISITOR_LOG_SOURCE") == "client":
+        return
 
     try:
         ip = request.headers.get("X-Forwarded-For", request.remote_addr)
-        country, city = "Unknown", "Unknown"
 
         # Parse UTM parameters
         utm_source = request.args.get("utm_source")
@@ -54,35 +96,21 @@ def log_visitor():
         utm_term = request.args.get("utm_term")
         utm_content = request.args.get("utm_content")
 
-        # Lookup country/city (optional)
-        if ip and not ip.startswith(("127.", "192.168.", "172.")):
-            try:
-                res = request.get(f"https://ipapi.co/{ip}/json/", timeout=3)
-                data = res.json()
-                country = data.get("country_name", "Unknown")
-                city = data.get("city", "Unknown")
-            except Exception:
-                pass
-
-        new_log = VisitorLog(
-            ip_address=ip,
-            country=country,
-            city=city,
-            user_agent=request.headers.get("User-Agent"),
-            referrer=request.referrer,
-            path=request.path,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            utm_campaign=utm_campaign,
-            utm_term=utm_term,
-            utm_content=utm_content,
-        )
-
-        db.session.add(new_log)
-        db.session.commit()
+        # Country/city are filled in later by `flask geo-enrich`
+        analytics_writer.submit(VisitorLog, {
+            "ip_address": ip,
+            "user_agent": request.headers.get("User-Agent"),
+            "referrer": request.referrer,
+            "path": request.path,
+            "utm_source": utm_source,
+            "utm_medium": utm_medium,
+            "utm_campaign": utm_campaign,
+            "utm_term": utm_term,
+            "utm_content": utm_content,
+            "created_at": datetime.utcnow(),
+        })
 
     except Exception as e:
-        db.session.rollback()
         print("Visitor logging failed:", e)
 
 
@@ -122,6 +150,125 @@ def create_admin():
         db.session.commit()
         print(f'Admin user {name} <{email}> created.')
 
+@app.cli.command("geo-enrich")
+@click.option("--table", "tables", multiple=True, type=click.Choice(sorted(ENRICHABLE_MODELS)),
+              help="Table to enrich (repeatable). Defaults to all.")
+@click.option("--batch-size", default=1000, show_default=True)
+@click.option("--all", "replay", is_flag=True, help="Re-resolve every row, e.g. after a GeoIP database update.")
+@click.option("--interval", default=0.0, help="Keep running, polling for new rows every N seconds.")
+def geo_enrich(tables, batch_size, replay, interval):
+    """Backfill country/city/region on visitor and blog view rows."""
+    if geo_resolver.backend is None:
+        print("No GeoIP database loaded; set GEOIP_DATABASE_PATH first.")
+        return
+
+    while True:
+        for name in tables or sorted(ENRICHABLE_MODELS):
+            count = enrich_geo(ENRICHABLE_MODELS[name], batch_size=batch_size, replay=replay)
+            print(f"{name}: enriched {count} rows")
+        if interval <= 0:
+            break
+        replay = False
+        time.sleep(interval)
+
+
+@app.cli.command("rollup")
+@click.option("--batch-size", default=50000, show_default=True)
+@click.option("--lag", default=300, show_default=True, help="Leave rows younger than this many seconds for the next run.")
+def rollup(batch_size, lag):
+    """Fold new visitor_log rows into the daily rollup tables."""
+    # Roll up enriched rows so the country dimension is filled in.
+    enriched_only = geo_resolver.backend is not None
+    if enriched_only:
+        enrich_geo(VisitorLog)
+    count = rollup_visitors(batch_size=batch_size, lag=timedelta(seconds=lag), enriched_only=enriched_only)
+    print(f"visitor_log: rolled up {count} rows")
+
+
+@app.cli.command("compress-static")
+@click.option("--min-size", default=1024, show_default=True, help="Skip files smaller than this many bytes.")
+def compress_static_command(min_size):
+    """Write .gz/.br siblings for text assets under the static folder."""
+    written = precompress_static(app.static_folder, min_size=min_size)
+    print(f"static: wrote {written} precompressed files")
+
+
+@app.cli.command("fingerprint-static")
+def fingerprint_static_command():
+    """Hash every static file into the manifest behind static_url()."""
+    count = static_manifest.build(app.static_folder)
+    print(f"static: fingerprinted {count} files into {static_manifest.manifest_path}")
+
+
+@app.cli.command("image-variants")
+def image_variants_command():
+    """Build responsive variants for uploaded blog images that do not have them yet."""
+    folder = os.path.join(app.static_folder, "uploads")
+    count = image_variants.process_missing(folder)
+    print(f"uploads: built variants for {count} images")
+
+
+@app.cli.command("gc-uploads")
+@click.option("--grace-hours", default=24, show_default=True, help="Keep blobs uploaded more recently than this.")
+@click.option("--dry-run", is_flag=True, help="List unreferenced blobs without deleting them.")
+def gc_uploads_command(grace_hours, dry_run):
+    """Delete uploaded images that no post references any more."""
+    removed = collect_garbage(grace=timedelta(hours=grace_hours), dry_run=dry_run)
+    for blob in removed:
+        print(f"{'would remove' if dry_run else 'removed'} {blob.path} ({blob.size} bytes)")
+    print(f"uploads: {len(removed)} unreferenced blobs {'found' if dry_run else 'removed'}")
+
+
+@app.cli.command("reader-sketches")
+@click.option("--batch-size", default=10000, show_default=True)
+def reader_sketches_command(batch_size):
+    """Rebuild per-post daily unique-reader sketches from blog_views history."""
+    count = rebuild_reader_sketches(batch_size=batch_size)
+    print(f"blog_views: folded {count} views into reader sketches")
+
+
+@app.cli.command("reconcile-counters")
+def reconcile_counters_command():
+    """Recompute the admin dashboard counters from the source tables."""
+    counts = dashboard_counters.reconcile()
+    for key in sorted(counts):
+        print(f"{key}: {counts[key]}")
+
+
+@app.cli.command("export")
+@click.argument("entity", type=click.Choice(sorted(EXPORTS)))
+@click.option("--format", "fmt", type=click.Choice(sorted(EXPORT_FORMATS)), default="csv", show_default=True)
+@click.option("--gzip", "compress", is_flag=True, help="Gzip the output.")
+@click.option("--since", type=click.DateTime(["%Y-%m-%d"]), help="Only rows created on or after this day.")
+@click.option("--until", type=click.DateTime(["%Y-%m-%d"]), help="Only rows created on or before this day.")
+@click.option("--filter", "filters", multiple=True, metavar="NAME=VALUE", help="Entity filter, e.g. status=new; repeatable.")
+@click.option("--output", "-o", default="-", show_default=True, help="File to write, or - for stdout.")
+@click.option("--batch-size", default=1000, show_default=True)
+def export_command(entity, fmt, compress, since, until, filters, output, batch_size):
+    """Stream leads, messages, visitors or blog-views as CSV/NDJSON."""
+    parsed = {}
+    for item in filters:
+        name, sep, value = item.partition("=")
+        if not sep or name not in EXPORTS[entity].filters:
+            raise click.BadParameter(f"expected one of {', '.join(EXPORTS[entity].filters)} as NAME=VALUE", param_hint="--filter")
+        parsed[name] = value
+    try:
+        chunks = iter_export(
+            entity,
+            fmt=fmt,
+            compress=compress,
+            since=since.date() if since else None,
+            until=until.date() if until else None,
+            filters=parsed,
+            batch_size=batch_size,
+        )
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--filter")
+    with click.open_file(output, "wb") as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+
+
 if __name__ == '__main__':
     # Run with the debug setting defined by the active configuration
     app.run(debug=app.config.get("DEBUG", False))
@@ -0,0 +1,37 @@
+"""Lead search pattern-ops indexes
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 00:37:33.845473
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.create_index('ix_leads_status_intent_created', ['status', 'intent', 'created_at', 'id'], unique=False)
+        # Prefix search; elsewhere the plain name and unique email/phone indexes already serve it.
+        if op.get_context().dialect.name == 'postgresql':
+            batch_op.drop_index('ix_leads_name')
+            batch_op.create_index('ix_leads_name', ['name'], unique=False, postgresql_ops={'name': 'varchar_pattern_ops'})
+            batch_op.create_index('ix_leads_email_prefix', ['email'], unique=False, postgresql_ops={'email': 'varchar_pattern_ops'})
+            batch_op.create_index('ix_leads_phone_prefix', ['phone'], unique=False, postgresql_ops={'phone': 'varchar_pattern_ops'})
+
+
+def downgrade():
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        if op.get_context().dialect.name == 'postgresql':
+            batch_op.drop_index('ix_leads_phone_prefix')
+            batch_op.drop_index('ix_leads_email_prefix')
+            batch_op.drop_index('ix_leads_name')
+            batch_op.create_index('ix_leads_name', ['name'], unique=False)
+        batch_op.drop_index('ix_leads_status_intent_created')
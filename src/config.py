@@ -32,6 +32,77 @@ class Config:
     LIVEKIT_STATIC_ROOM = os.environ.get("LIVEKIT_STATIC_ROOM")
     LIVEKIT_STATIC_IDENTITY = os.environ.get("LIVEKIT_STATIC_IDENTITY")
 
+    # Write-behind analytics pipeline (visitor logs are bulk-inserted off the request path)
+    ANALYTICS_QUEUE_SIZE = int(os.environ.get("ANALYTICS_QUEUE_SIZE", 10000))
+    ANALYTICS_BATCH_SIZE = int(os.environ.get("ANALYTICS_BATCH_SIZE", 500))
+    ANALYTICS_FLUSH_INTERVAL = float(os.environ.get("ANALYTICS_FLUSH_INTERVAL", 5))
+    ANALYTICS_SPOOL_PATH = os.environ.get(
+        "ANALYTICS_SPOOL_PATH",
+        os.path.join(os.path.dirname(BASE_DIR), "logs", "analytics_spool.jsonl"),
+    )
+
+    # Offline GeoIP lookups (CSV/CSV.gz IP-range database, e.g. DB-IP "IP to City Lite")
+    GEOIP_DATABASE_PATH = os.environ.get("GEOIP_DATABASE_PATH")
+    GEOIP_CACHE_SIZE = int(os.environ.get("GEOIP_CACHE_SIZE", 50000))
+    GEOIP_CACHE_TTL = float(os.environ.get("GEOIP_CACHE_TTL", 6 * 60 * 60))
+
+    # Posts per page on the blog index (keyset-paginated on created_at, id)
+    BLOG_PAGE_SIZE = int(os.environ.get("BLOG_PAGE_SIZE", 12))
+
+    # Leads per page in the admin inbox; conversations / thread messages per page
+    LEAD_PAGE_SIZE = int(os.environ.get("LEAD_PAGE_SIZE", 50))
+    MESSAGE_PAGE_SIZE = int(os.environ.get("MESSAGE_PAGE_SIZE", 50))
+
+    # Seconds a worker may reuse a signed-in admin's identity without reading users
+    ADMIN_IDENTITY_TTL = float(os.environ.get("ADMIN_IDENTITY_TTL", 30))
+
+    # Dashboard counters: delta flush and in-memory read cache intervals (seconds)
+    DASHBOARD_COUNTER_FLUSH_INTERVAL = float(os.environ.get("DASHBOARD_COUNTER_FLUSH_INTERVAL", 5))
+    DASHBOARD_COUNTER_CACHE_TTL = float(os.environ.get("DASHBOARD_COUNTER_CACHE_TTL", 5))
+
+    # sitemap.xml is rebuilt only when published posts change; past
+    # SITEMAP_MAX_URLS it becomes an index of /sitemap-<n>.xml files
+    SITEMAP_MAX_URLS = int(os.environ.get("SITEMAP_MAX_URLS", 50000))
+    SITEMAP_CACHE_TTL = float(os.environ.get("SITEMAP_CACHE_TTL", 24 * 60 * 60))
+
+    # Content-hash manifest for static_url(); written by `flask fingerprint-static`
+    STATIC_MANIFEST_PATH = os.environ.get("STATIC_MANIFEST_PATH")
+
+    # Blog image uploads are stored content-addressed (sha256) and deduplicated
+    MAX_IMAGE_UPLOAD_BYTES = int(os.environ.get("MAX_IMAGE_UPLOAD_BYTES", 10 * 1024 * 1024))
+
+    # Responsive variants of blog uploads, built in a process pool (needs Pillow)
+    IMAGE_VARIANT_WORKERS = int(os.environ.get("IMAGE_VARIANT_WORKERS", 2))
+    IMAGE_VARIANT_WIDTHS = os.environ.get("IMAGE_VARIANT_WIDTHS", "480,960,1600")
+    IMAGE_VARIANT_FORMATS = os.environ.get("IMAGE_VARIANT_FORMATS", "avif,webp")
+    IMAGE_VARIANT_QUALITY = int(os.environ.get("IMAGE_VARIANT_QUALITY", 80))
+
+    # gzip/brotli response compression (disable when a proxy already compresses)
+    COMPRESSION_ENABLED = os.environ.get("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+    COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_LEVEL = int(os.environ.get("COMPRESSION_LEVEL", 6))
+
+    # Marketing pages prerendered per host as identity/gzip/brotli bytes
+    PRERENDER_CACHE_SIZE = int(os.environ.get("PRERENDER_CACHE_SIZE", 256))
+    PRERENDER_MAX_AGE = int(os.environ.get("PRERENDER_MAX_AGE", 300))
+
+    # Rendered blog detail pages, keyed by slug + post version
+    BLOG_PAGE_CACHE_SIZE = int(os.environ.get("BLOG_PAGE_CACHE_SIZE", 500))
+    BLOG_PAGE_CACHE_TTL = float(os.environ.get("BLOG_PAGE_CACHE_TTL", 60 * 60))
+
+    # Buffered Post.view_count increments, flushed as one UPDATE per interval
+    VIEW_COUNT_FLUSH_INTERVAL = float(os.environ.get("VIEW_COUNT_FLUSH_INTERVAL", 10))
+
+    # Coalesced blog read heartbeats (/blog/<slug>/track)
+    READ_TRACKING_FLUSH_INTERVAL = float(os.environ.get("READ_TRACKING_FLUSH_INTERVAL", 5))
+    READ_TRACKING_MAX_PENDING = int(os.environ.get("READ_TRACKING_MAX_PENDING", 20000))
+
+    # HyperLogLog unique-reader sketches per post per day
+    READER_SKETCH_FLUSH_INTERVAL = float(os.environ.get("READER_SKETCH_FLUSH_INTERVAL", 30))
+
+    # "server" logs page views in log_visitor; "client" lets the browser send them to /collect
+    VISITOR_LOG_SOURCE = os.environ.get("VISITOR_LOG_SOURCE", "server").lower()
+
     # Shared engine + session for non-Flask contexts (e.g., LiveKit workers)
     engine = create_engine(SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
     SessionLocal = sessionmaker(bind=engine)
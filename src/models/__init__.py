@@ -1,3 +1,9 @@
-from src.models.database import db, Lead, Message, Interaction, User, Post, Tag, VisitorLog
+from src.models.database import (
+    db, Lead, Message, Interaction, User, Post, Tag, VisitorLog, ClientEvent,
+    VisitorDailyRollup, RollupWatermark, PostReaderSketch, UploadBlob, DashboardCounter,
+)
 
-__all__ = ["db", "Lead", "Message", "Interaction", "User", "Post", "Tag", "VisitorLog"]
\ No newline at end of file
+__all__ = [
+    "db", "Lead", "Message", "Interaction", "User", "Post", "Tag", "VisitorLog", "ClientEvent",
+    "VisitorDailyRollup", "RollupWatermark", "PostReaderSketch", "UploadBlob", "DashboardCounter",
+]
\ No newline at end of file
@@ -8,6 +8,23 @@ db = SQLAlchemy()
 
 class Lead(db.Model):
     __tablename__ = "leads"
+    # Admin inbox: newest-first keyset pages, optionally narrowed by status /
+    # source / intent, each walked in (created_at, id) order by its own index.
+    # Search is a prefix LIKE; outside the C collation Postgres can only serve
+    # that from a *_pattern_ops index, so name/email/phone get one there.
+    __table_args__ = (
+        db.Index("ix_leads_created", "created_at", "id"),
+        db.Index("ix_leads_status_created", "status", "created_at", "id"),
+        db.Index("ix_leads_source_created", "source", "created_at", "id"),
+        db.Index("ix_leads_intent_created", "intent", "created_at", "id"),
+        db.Index("ix_leads_status_source_created", "status", "source", "created_at", "id"),
+        db.Index("ix_leads_status_intent_created", "status", "intent", "created_at", "id"),
+        db.Index("ix_leads_name", "name", postgresql_ops={"name": "varchar_pattern_ops"}),
+        db.Index("ix_leads_email_prefix", "email", postgresql_ops={"email": "varchar_pattern_ops"})
+        .ddl_if(dialect="postgresql"),
+        db.Index("ix_leads_phone_prefix", "phone", postgresql_ops={"phone": "varchar_pattern_ops"})
+        .ddl_if(dialect="postgresql"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
@@ -43,6 +60,8 @@ class Lead(db.Model):
 
 class Message(db.Model):
     __tablename__ = "message"
+    # Threads are read per lead, newest first; also serves the latest-per-lead window.
+    __table_args__ = (db.Index("ix_message_lead_created", "lead_id", "created_at", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     lead_id = db.Column(db.Integer, db.ForeignKey("leads.id"), nullable=False)
@@ -92,6 +111,13 @@ class Interaction(db.Model):
 
 class VisitorLog(db.Model):
     __tablename__ = 'visitor_log'
+    # Rows still waiting for `flask enrich-geo`; they leave the index once a country is set.
+    __table_args__ = (
+        db.Index(
+            "ix_visitor_log_geo_pending", "id",
+            postgresql_where=db.text("country IS NULL"), sqlite_where=db.text("country IS NULL"),
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     ip_address = db.Column(db.String(100))
@@ -107,8 +133,53 @@ class VisitorLog(db.Model):
     utm_term = db.Column(db.String(100))
     utm_content = db.Column(db.String(100))
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Indexed for `flask rollup`, which re-aggregates whole days.
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+
+
+# Visit counts per day x path x UTM x country, maintained by `flask rollup`
+class VisitorDailyRollup(db.Model):
+    __tablename__ = "visitor_daily_rollup"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "day", "path", "utm_source", "utm_medium", "utm_campaign", "country",
+            name="uq_visitor_daily_rollup_key",
+        ),
+    )
 
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False, index=True)
+    # Dimensions use '' instead of NULL so the unique key matches on every backend
+    path = db.Column(db.String(200), nullable=False, default="")
+    utm_source = db.Column(db.String(100), nullable=False, default="")
+    utm_medium = db.Column(db.String(100), nullable=False, default="")
+    utm_campaign = db.Column(db.String(100), nullable=False, default="")
+    country = db.Column(db.String(100), nullable=False, default="")
+    hits = db.Column(db.Integer, nullable=False, default=0)
+
+
+# Highest source row id already folded into a rollup table
+class RollupWatermark(db.Model):
+    __tablename__ = "rollup_watermarks"
+
+    name = db.Column(db.String(50), primary_key=True)
+    last_id = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ClientEvent(db.Model):
+    __tablename__ = "client_events"
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_type = db.Column(db.String(30), nullable=False)  # e.g. 'cta_click'
+    path = db.Column(db.String(200))
+    label = db.Column(db.String(120))
+    target = db.Column(db.String(500))
+    fingerprint = db.Column(db.String(64))
+    ip_address = db.Column(db.String(100))
+    user_agent = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
 
 
@@ -138,6 +209,8 @@ class User(db.Model):
 
 class Post(db.Model):
     __tablename__ = "posts"
+    # Serves the keyset-paginated blog index (newest published first)
+    __table_args__ = (db.Index("ix_posts_published_created", "is_published", "created_at", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -198,14 +271,21 @@ post_tags = db.Table(
     "post_tags",
     db.Column("post_id", db.Integer, db.ForeignKey("posts.id")),
     db.Column("tag_id", db.Integer, db.ForeignKey("tags.id")),
+    db.Index("ix_post_tags_tag_post", "tag_id", "post_id"),
 )
 
 
 class BlogView(db.Model):
     __tablename__ = "blog_views"
+    __table_args__ = (
+        db.Index(
+            "ix_blog_views_geo_pending", "id",
+            postgresql_where=db.text("country IS NULL"), sqlite_where=db.text("country IS NULL"),
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    post_id = db.Column(db.Integer, db.ForeignKey("posts.id"), nullable=False)
+    post_id = db.Column(db.Integer, db.ForeignKey("posts.id"), nullable=False, index=True)
     fingerprint = db.Column(db.String(64), index=True)
     ip_address = db.Column(db.String(120))
     country = db.Column(db.String(100))
@@ -218,8 +298,43 @@ class BlogView(db.Model):
     utm_medium = db.Column(db.String(120))
     utm_campaign = db.Column(db.String(120))
     read_duration = db.Column(db.Integer)  # seconds
+    scroll_depth = db.Column(db.Integer)  # max % of the article scrolled
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+# Content-addressed upload index, one row per distinct file (see src/utils/upload_store.py)
+class UploadBlob(db.Model):
+    __tablename__ = "upload_blobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    sha256 = db.Column(db.String(64), unique=True, nullable=False)
+    path = db.Column(db.String(255), nullable=False)  # relative to the static folder
+    size = db.Column(db.Integer, nullable=False)
+    content_type = db.Column(db.String(100))
+    original_name = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)  # refreshed on every dedup hit
+
+
+# One HyperLogLog sketch of reader fingerprints per post per day (see src/utils/hyperloglog.py)
+class PostReaderSketch(db.Model):
+    __tablename__ = "post_reader_sketches"
+    __table_args__ = (
+        db.UniqueConstraint("post_id", "day", name="uq_post_reader_sketches_post_day"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    post_id = db.Column(db.Integer, db.ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    sketch = db.Column(db.LargeBinary, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# Dashboard totals kept current from the write paths (see src/utils/dashboard_counters.py)
+class DashboardCounter(db.Model):
+    __tablename__ = "dashboard_counters"
 
+    key = db.Column(db.String(120), primary_key=True)  # e.g. "posts", "leads:status:new", "visitors:2025-01-31"
+    value = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
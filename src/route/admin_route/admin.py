@@ -1,15 +1,50 @@
-from flask import Blueprint, render_template, request, jsonify,redirect,url_for, make_response, current_app, session, g
-from datetime import datetime
+from flask import Blueprint, render_template, request, jsonify,redirect,url_for, make_response, current_app, session, g, abort
+from datetime import date, datetime, timedelta
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from flask import flash
+from sqlalchemy.orm import joinedload, selectinload
+from flask import flash, Response, stream_with_context
 from src.utils.seo import meta_tags
+from src.utils.view_counter import view_counter
+from src.utils.read_tracker import read_heartbeats
+from src.utils.rollup import visitor_trends
+from src.utils.blog_analytics import post_read_stats
+from src.utils.reader_sketches import reader_sketches, unique_readers
+from src.utils.pagination import keyset_page
+from src.utils.upload_store import UploadTooLarge, store_upload
+from src.utils.slugs import flush_with_unique_slug
+from src.utils.dashboard_counters import dashboard_counters, daily_key
+from src.utils.admin_identity import SESSION_STAMP_KEY, admin_identities, identity_stamp
+from src.utils.tags import resolve_tags
+from src.utils.exports import EXPORT_FORMATS, EXPORTS, export_filename, iter_export
+from src.utils.conversations import latest_messages_query, thread_sizes
+from src.utils.lead_filters import (
+    LEAD_SOURCES,
+    LEAD_STATUSES,
+    filter_leads,
+    lead_filter_args,
+    lead_filters_from_args,
+    lead_intents,
+)
+from src.utils.blog_cache import (
+    BLOG_VIEW_COOKIE,
+    VIEW_COUNT_PLACEHOLDER,
+    blog_page_cache,
+    fill_view_count,
+)
+from src.utils.conditional import (
+    apply_validators,
+    cacheable_request,
+    compute_etag,
+    conditional,
+    last_modified_for,
+    not_modified,
+    published_posts_version,
+)
 from src.models.database import Post, Tag, User, BlogView, Lead, Message, VisitorLog
 from werkzeug.utils import secure_filename
 import os
 import uuid
-import json
-from urllib.request import urlopen, Request
-from collections import Counter
 from src.models.database import db, Lead
 from functools import wraps
 
@@ -20,9 +55,11 @@ import re
 from slugify import slugify
 
 ALLOWED_IMAGE_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
+VISITOR_TREND_RANGES = (7, 30, 90, 365)
+READER_RANGES = {"7d": 7, "30d": 30, "90d": 90, "all": None}
 
 
-def _save_cover_image(file_storage, title):
+def _save_image(file_storage, folder_setting, default_folder):
     filename = secure_filename(file_storage.filename)
     if not filename:
         return None
@@ -32,58 +69,31 @@ def _save_cover_image(file_storage, title):
         return None
 
     upload_root = current_app.config.get(
-        "BLOG_COVER_UPLOAD_FOLDER",
-        os.path.join(current_app.static_folder, "uploads", "blog_covers"),
+        folder_setting,
+        os.path.join(current_app.static_folder, "uploads", default_folder),
+    )
+    return store_upload(
+        file_storage,
+        upload_root,
+        ".jpg" if ext == ".jpeg" else ext,
+        max_bytes=current_app.config.get("MAX_IMAGE_UPLOAD_BYTES", 10 * 1024 * 1024),
     )
-    os.makedirs(upload_root, exist_ok=True)
 
-    base_slug = slugify(title) or "vertikal-cover"
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    final_name = f"{base_slug}-{timestamp}{ext}"
 
-    file_path = os.path.join(upload_root, final_name)
-    file_storage.save(file_path)
+def _save_cover_image(file_storage):
+    return _save_image(file_storage, "BLOG_COVER_UPLOAD_FOLDER", "blog_covers")
 
-    relative_path = os.path.relpath(file_path, current_app.static_folder)
-    return f"/static/{relative_path.replace(os.sep, '/')}"
 
+def _save_body_image(file_storage):
+    return _save_image(file_storage, "BLOG_BODY_UPLOAD_FOLDER", "blog_images")
 
-def _save_body_image(file_storage, title="blog-image"):
-    filename = secure_filename(file_storage.filename)
-    if not filename:
-        return None
 
-    ext = os.path.splitext(filename)[1].lower()
-    if ext.replace(".", "") not in ALLOWED_IMAGE_EXTENSIONS:
-        return None
+def _upload_limit_mb():
+    return current_app.config.get("MAX_IMAGE_UPLOAD_BYTES", 10 * 1024 * 1024) // (1024 * 1024)
 
-    upload_root = current_app.config.get(
-        "BLOG_BODY_UPLOAD_FOLDER",
-        os.path.join(current_app.static_folder, "uploads", "blog_images"),
-    )
-    os.makedirs(upload_root, exist_ok=True)
 
-    base_slug = slugify(title) or "vertikal-image"
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    final_name = f"{base_slug}-{timestamp}{ext}"
-
-    file_path = os.path.join(upload_root, final_name)
-    file_storage.save(file_path)
-
-    relative_path = os.path.relpath(file_path, current_app.static_folder)
-    return f"/static/{relative_path.replace(os.sep, '/')}"
-
-def generate_unique_slug(title, current_post=None):
-    base_slug = slugify(title) or f"post-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
-    slug = base_slug
-    counter = 2
-
-    while True:
-        existing = Post.query.filter_by(slug=slug).first()
-        if not existing or (current_post and existing.id == current_post.id):
-            return slug
-        slug = f"{base_slug}-{counter}"
-        counter += 1
+def post_base_slug(title):
+    return slugify(title) or f"post-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
 
 
 def detect_device(user_agent):
@@ -104,36 +114,25 @@ def get_form_data():
         return {key: values[-1] if values else "" for key, values in parsed.items()}
 
 
-def lookup_geo(ip_address):
-    if not ip_address:
-        return {}
-    if ip_address.startswith(("127.", "10.", "192.168.", "172.16.", "172.17.", "172.18.", "172.19.", "172.20.", "172.21.", "172.22.", "172.23.", "172.24.", "172.25.", "172.26.", "172.27.", "172.28.", "172.29.", "172.30.", "172.31.")):
-        return {}
-    try:
-        request = Request(
-            f"https://ipapi.co/{ip_address}/json/",
-            headers={"User-Agent": "VertikalAgent/1.0 (+https://vertikalagent.com)"},
-        )
-        with urlopen(request, timeout=3) as response:
-            if response.status != 200:
-                return {}
-            data = json.loads(response.read().decode("utf-8"))
-            if data.get("error"):
-                return {}
-        return {
-            "country": data.get("country_name"),
-            "city": data.get("city"),
-            "region": data.get("region"),
-        }
-    except Exception:
-        return {}
+def _clear_admin_session():
+    for key in ("admin_user_id", "admin_user_name", "admin_user_role", SESSION_STAMP_KEY):
+        session.pop(key, None)
 
 
 def get_current_admin():
     user_id = session.get("admin_user_id")
     if not user_id:
         return None
-    return User.query.get(user_id)
+    identity = admin_identities.resolve(user_id, session.get(SESSION_STAMP_KEY))
+    if identity is None:
+        # Deleted while signed in; drop the session so /login does not bounce back here.
+        _clear_admin_session()
+        return None
+    if session.get(SESSION_STAMP_KEY) != identity.stamp:
+        session[SESSION_STAMP_KEY] = identity.stamp
+        session["admin_user_name"] = identity.name
+        session["admin_user_role"] = identity.role
+    return identity
 
 
 def admin_login_required(view_func):
@@ -174,6 +173,7 @@ def login():
         session["admin_user_id"] = user.id
         session["admin_user_name"] = user.name
         session["admin_user_role"] = user.role
+        session[SESSION_STAMP_KEY] = identity_stamp(user)
         flash(f"Welcome back, {user.name.split()[0]}!", "success")
 
         next_url = request.args.get("next") or request.form.get("next")
@@ -187,9 +187,7 @@ def login():
 
 @admin_bp.route("/logout")
 def logout():
-    session.pop("admin_user_id", None)
-    session.pop("admin_user_name", None)
-    session.pop("admin_user_role", None)
+    _clear_admin_session()
     flash("You have been signed out.", "info")
     return redirect(url_for("admin.login"))
 
@@ -198,15 +196,26 @@ def logout():
 @admin_login_required
 def dashboard():
     admin_user = g.current_admin
-    published_posts = Post.query.filter_by(is_published=True).count()
-    total_posts = Post.query.count()
-    total_users = User.query.count()
-    last_post = Post.query.order_by(Post.created_at.desc()).first()
+    counts = dashboard_counters.snapshot()
+    today = datetime.utcnow().date()
+    yesterday = today - timedelta(days=1)
+    # Newest by primary key: an index lookup instead of sorting posts by created_at.
+    last_post = db.session.execute(select(Post.title, Post.slug).order_by(Post.id.desc()).limit(1)).first()
 
     stats = {
-        "total_posts": total_posts,
-        "published_posts": published_posts,
-        "total_users": total_users,
+        "total_posts": counts.get("posts", 0),
+        "published_posts": counts.get("posts:published", 0),
+        "total_users": counts.get("users", 0),
+        "total_leads": counts.get("leads", 0),
+        "leads_by_status": {
+            status: counts.get(f"leads:status:{status}", 0) for status in LEAD_STATUSES
+        },
+        "leads_today": counts.get(daily_key("leads", today), 0),
+        "leads_yesterday": counts.get(daily_key("leads", yesterday), 0),
+        "messages_today": counts.get(daily_key("messages", today), 0),
+        "messages_yesterday": counts.get(daily_key("messages", yesterday), 0),
+        "visitors_today": counts.get(daily_key("visitors", today), 0),
+        "visitors_yesterday": counts.get(daily_key("visitors", yesterday), 0),
         "last_post": last_post,
     }
 
@@ -242,7 +251,11 @@ def add_blog():
 
         cover_image = cover_image_url or None
         if cover_upload and cover_upload.filename:
-            saved_cover_path = _save_cover_image(cover_upload, title)
+            try:
+                saved_cover_path = _save_cover_image(cover_upload)
+            except UploadTooLarge:
+                flash(f"Cover image is too large. The limit is {_upload_limit_mb()} MB.", "danger")
+                return redirect(url_for("admin.add_blog"))
             if not saved_cover_path:
                 flash("Unsupported cover image format. Please upload PNG, JPG, JPEG, GIF, or WEBP.", "danger")
                 return redirect(url_for("admin.add_blog"))
@@ -272,32 +285,12 @@ def add_blog():
             meta_description=meta_description,
             meta_keywords=meta_keywords
         )
-        new_post.slug = generate_unique_slug(title, new_post)
-        tag_objects = []
-        if raw_tags:
-            seen_slugs = set()
-            for candidate in raw_tags.split(","):
-                cleaned_name = " ".join(candidate.strip().split())
-                if not cleaned_name:
-                    continue
-
-                tag_slug = slugify(cleaned_name)
-                if not tag_slug or tag_slug in seen_slugs:
-                    continue
-
-                tag = Tag.query.filter_by(slug=tag_slug).first()
-                if not tag:
-                    tag = Tag(name=cleaned_name)
-                    tag.slug = tag_slug
-                    db.session.add(tag)
-
-                tag_objects.append(tag)
-                seen_slugs.add(tag_slug)
+        tag_objects = resolve_tags(raw_tags)
 
+        flush_with_unique_slug(new_post, post_base_slug(title))
         new_post.tags = tag_objects
-
-        db.session.add(new_post)
         db.session.commit()
+        blog_page_cache.invalidate(new_post.slug)
         flash("Blog added successfully!", "success")
         return redirect(url_for("admin.manage_blogs"))
 
@@ -316,40 +309,24 @@ def add_blog():
 @admin_bp.route("/blogs/manage")
 @admin_login_required
 def manage_blogs():
-    posts = Post.query.order_by(Post.created_at.desc()).all()
-    analytics = {}
-
-    for post in posts:
-        views = post.views or []
-        total_reads = len(views)
-        total_duration = sum(view.read_duration or 0 for view in views if view.read_duration)
-        avg_read_time = round(total_duration / total_reads, 1) if total_reads else 0
-        fingerprints = {view.fingerprint for view in views if view.fingerprint}
-
-        location_counter = Counter()
-        for view in views:
-            location_key = (view.country or "Unknown", view.city or "")
-            location_counter[location_key] += 1
-
-        if location_counter:
-            top_location, _ = location_counter.most_common(1)[0]
-            country, city = top_location
-            top_location_label = f"{city}, {country}" if city else country
-        else:
-            top_location_label = "—"
+    reader_range = request.args.get("range", "all")
+    if reader_range not in READER_RANGES:
+        reader_range = "all"
+    days = READER_RANGES[reader_range]
+    since = datetime.utcnow().date() - timedelta(days=days - 1) if days else None
 
-        analytics[post.id] = {
-            "total_reads": total_reads,
-            "unique_readers": len(fingerprints),
-            "avg_read_time": avg_read_time,
-            "top_location": top_location_label,
-        }
+    posts = Post.query.options(selectinload(Post.tags)).order_by(Post.created_at.desc()).all()
+    analytics = post_read_stats()
+    for post_id, readers in unique_readers(since=since).items():
+        analytics.setdefault(post_id, {})["unique_readers"] = readers
 
     return render_template(
         "admin_blog_manage.html",
         posts=posts,
         admin=g.current_admin,
         analytics=analytics,
+        reader_range=reader_range,
+        reader_ranges=READER_RANGES,
     )
 
 
@@ -362,12 +339,14 @@ def upload_blog_image():
     Returns a JSON object with the public URL.
     """
     file_storage = request.files.get("image") or request.files.get("file")
-    title = (request.form.get("title") or request.form.get("context_title") or "blog-image").strip()
 
     if not file_storage or not getattr(file_storage, "filename", ""):
         return jsonify({"error": "no_file"}), 400
 
-    saved_url = _save_body_image(file_storage, title=title or "blog-image")
+    try:
+        saved_url = _save_body_image(file_storage)
+    except UploadTooLarge:
+        return jsonify({"error": "file_too_large", "max_mb": _upload_limit_mb()}), 413
     if not saved_url:
         return jsonify({"error": "unsupported_format"}), 400
 
@@ -377,6 +356,10 @@ def upload_blog_image():
 @admin_bp.route("/analytics/visitors")
 @admin_login_required
 def visitor_logs():
+    days = request.args.get("days", 30, type=int)
+    if days not in VISITOR_TREND_RANGES:
+        days = 30
+
     logs = (
         VisitorLog.query.order_by(VisitorLog.created_at.desc())
         .limit(500)
@@ -385,6 +368,8 @@ def visitor_logs():
     return render_template(
         "admin_visitors.html",
         logs=logs,
+        trends=visitor_trends(days=days),
+        trend_ranges=VISITOR_TREND_RANGES,
         admin=g.current_admin,
     )
 
@@ -392,10 +377,27 @@ def visitor_logs():
 @admin_bp.route("/leads")
 @admin_login_required
 def lead_list():
-    leads = Lead.query.order_by(Lead.created_at.desc()).all()
+    filters = lead_filters_from_args(request.args)
+    page = keyset_page(
+        filter_leads(select(Lead), filters),
+        Lead.created_at,
+        Lead.id,
+        page_size=current_app.config.get("LEAD_PAGE_SIZE", 50),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+    )
+    filter_args = lead_filter_args(filters)
     return render_template(
         "admin_leads.html",
-        leads=leads,
+        leads=page.items,
+        filters=filters,
+        filtered=bool(filter_args),
+        filter_args=filter_args,
+        statuses=LEAD_STATUSES,
+        sources=LEAD_SOURCES,
+        intents=lead_intents(),
+        next_url=url_for("admin.lead_list", after=page.next_cursor, **filter_args) if page.next_cursor else None,
+        prev_url=url_for("admin.lead_list", before=page.prev_cursor, **filter_args) if page.prev_cursor else None,
         admin=g.current_admin,
     )
 
@@ -403,18 +405,83 @@ def lead_list():
 @admin_bp.route("/messages")
 @admin_login_required
 def message_list():
-    messages = (
-        Message.query.order_by(Message.created_at.desc())
-        .limit(500)
-        .all()
+    page = keyset_page(
+        latest_messages_query(),
+        Message.created_at,
+        Message.id,
+        page_size=current_app.config.get("MESSAGE_PAGE_SIZE", 50),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
     )
     return render_template(
         "admin_messages.html",
-        messages=messages,
+        conversations=page.items,
+        thread_sizes=thread_sizes([message.lead_id for message in page.items]),
+        next_url=url_for("admin.message_list", after=page.next_cursor) if page.next_cursor else None,
+        prev_url=url_for("admin.message_list", before=page.prev_cursor) if page.prev_cursor else None,
+        admin=g.current_admin,
+    )
+
+
+@admin_bp.route("/messages/<int:lead_id>")
+@admin_login_required
+def message_thread(lead_id):
+    lead = Lead.query.get_or_404(lead_id)
+    page = keyset_page(
+        select(Message).where(Message.lead_id == lead.id),
+        Message.created_at,
+        Message.id,
+        page_size=current_app.config.get("MESSAGE_PAGE_SIZE", 50),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+    )
+    return render_template(
+        "admin_message_thread.html",
+        lead=lead,
+        # Pages are fetched newest first; threads read oldest first.
+        messages=page.items[::-1],
+        older_url=url_for("admin.message_thread", lead_id=lead.id, after=page.next_cursor) if page.next_cursor else None,
+        newer_url=url_for("admin.message_thread", lead_id=lead.id, before=page.prev_cursor) if page.prev_cursor else None,
         admin=g.current_admin,
     )
 
 
+@admin_bp.route("/export/<entity>")
+@admin_login_required
+def export_entity(entity):
+    """
+    Stream ``entity`` as CSV/NDJSON (``?format=``), gzipped with ``?gzip=1``.
+
+    Accepts ``since``/``until`` dates plus the entity's filters, e.g.
+    ``/admin/export/leads?status=new&since=2025-01-01``.
+    """
+    if entity not in EXPORTS:
+        abort(404)
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        abort(400, description=f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    compress = request.args.get("gzip", "").lower() in {"1", "true", "yes"}
+    try:
+        since, until = (
+            date.fromisoformat(request.args[name]) if request.args.get(name) else None
+            for name in ("since", "until")
+        )
+        chunks = iter_export(
+            entity, fmt=fmt, compress=compress, since=since, until=until, filters=request.args.to_dict()
+        )
+    except ValueError as exc:
+        abort(400, description=str(exc))
+
+    response = Response(
+        stream_with_context(chunks),
+        mimetype="application/gzip" if compress else EXPORT_FORMATS[fmt],
+    )
+    response.headers["Content-Disposition"] = f'attachment; filename="{export_filename(entity, fmt, compress)}"'
+    # Let a buffering reverse proxy pass chunks through as they are produced.
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
 @admin_bp.route("/users")
 @admin_login_required
 def manage_users():
@@ -468,6 +535,7 @@ def edit_user(user_id):
             user.set_password(password.strip())
 
         db.session.commit()
+        admin_identities.invalidate(user.id)
         flash(f"Updated {user.name}.", "success")
         return redirect(url_for("admin.manage_users"))
 
@@ -493,6 +561,7 @@ def delete_user(user_id):
 
     db.session.delete(user)
     db.session.commit()
+    admin_identities.invalidate(user.id)
     flash(f"Removed {user.name}.", "success")
     return redirect(url_for("admin.manage_users"))
 
@@ -529,7 +598,11 @@ def edit_blog(post_id):
         elif form.get("cover_image") is not None and not cover_upload:
             cover_image = None
         if cover_upload and cover_upload.filename:
-            saved_cover_path = _save_cover_image(cover_upload, title)
+            try:
+                saved_cover_path = _save_cover_image(cover_upload)
+            except UploadTooLarge:
+                flash(f"Cover image is too large. The limit is {_upload_limit_mb()} MB.", "danger")
+                return redirect(url_for("admin.edit_blog", post_id=post.id))
             if not saved_cover_path:
                 flash("Unsupported cover image format. Please upload PNG, JPG, JPEG, GIF, or WEBP.", "danger")
                 return redirect(url_for("admin.edit_blog", post_id=post.id))
@@ -545,8 +618,8 @@ def edit_blog(post_id):
         if not meta_description:
             meta_description = excerpt[:160]
 
-        if title != post.title:
-            post.slug = generate_unique_slug(title, post)
+        previous_slug = post.slug
+        title_changed = title != post.title
 
         post.title = title
         post.subtitle = subtitle
@@ -558,31 +631,15 @@ def edit_blog(post_id):
         post.meta_keywords = meta_keywords
         post.is_published = True
 
-        tag_objects = []
-        if raw_tags:
-            seen_slugs = set()
-            for candidate in raw_tags.split(","):
-                cleaned_name = " ".join(candidate.strip().split())
-                if not cleaned_name:
-                    continue
-
-                tag_slug = slugify(cleaned_name)
-                if not tag_slug or tag_slug in seen_slugs:
-                    continue
-
-                tag = Tag.query.filter_by(slug=tag_slug).first()
-                if not tag:
-                    tag = Tag(name=cleaned_name)
-                    tag.slug = tag_slug
-                    db.session.add(tag)
-
-                tag_objects.append(tag)
-                seen_slugs.add(tag_slug)
+        tag_objects = resolve_tags(raw_tags)
 
         post.tags = tag_objects
         post.updated_at = datetime.utcnow()
 
+        if title_changed:
+            flush_with_unique_slug(post, post_base_slug(title))
         db.session.commit()
+        blog_page_cache.invalidate(previous_slug, post.slug)
         flash("Blog updated successfully!", "success")
         return redirect(url_for("admin.manage_blogs"))
 
@@ -612,8 +669,10 @@ def delete_blog(post_id):
 
     post = Post.query.get_or_404(post_id)
     title = post.title
+    slug = post.slug
     db.session.delete(post)
     db.session.commit()
+    blog_page_cache.invalidate(slug)
     flash(f"Deleted “{title}”.", "success")
     return redirect(url_for("admin.manage_blogs"))
 
@@ -657,17 +716,27 @@ def create_user():
     return render_template("admin_user_new.html", admin=admin_user)
 
 
+def _blog_list_version():
+    count, newest = published_posts_version()
+    return (count, newest), newest
+
+
+@conditional(_blog_list_version)
 def render_blog_list_page():
     tag_slug = request.args.get("tag")
     tags = Tag.query.order_by(Tag.name.asc()).all()
 
-    posts_query = Post.query.filter_by(is_published=True)
+    posts_query = (
+        select(Post)
+        .where(Post.is_published.is_(True))
+        .options(selectinload(Post.tags), selectinload(Post.author))
+    )
     active_tag = None
 
     if tag_slug:
         active_tag = next((tag for tag in tags if tag.slug == tag_slug), None)
         if active_tag:
-            posts_query = posts_query.join(Post.tags).filter(Tag.id == active_tag.id)
+            posts_query = posts_query.join(Post.tags).where(Tag.id == active_tag.id)
         else:
             return render_template(
                 "blog_list.html",
@@ -677,13 +746,23 @@ def render_blog_list_page():
                 requested_tag=tag_slug,
             )
 
-    posts = posts_query.order_by(Post.created_at.desc()).all()
+    page = keyset_page(
+        posts_query,
+        Post.created_at,
+        Post.id,
+        page_size=current_app.config.get("BLOG_PAGE_SIZE", 12),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+    )
+    page_args = {"tag": active_tag.slug} if active_tag else {}
     return render_template(
         "blog_list.html",
-        posts=posts,
+        posts=page.items,
         tags=tags,
         active_tag=active_tag,
         requested_tag=tag_slug,
+        next_url=url_for(request.endpoint, after=page.next_cursor, **page_args) if page.next_cursor else None,
+        prev_url=url_for(request.endpoint, before=page.prev_cursor, **page_args) if page.prev_cursor else None,
     )
 
 
@@ -694,8 +773,14 @@ def all_blogs():
 
 
 def render_blog_detail_page(slug):
-    post = Post.query.filter_by(slug=slug, is_published=True).first_or_404()
-    post.view_count += 1
+    current = db.session.execute(
+        select(Post.id, Post.created_at, Post.updated_at, Post.view_count)
+        .where(Post.slug == slug, Post.is_published.is_(True))
+    ).first()
+    if current is None:
+        abort(404)
+
+    view_counter.increment(current.id)
 
     fingerprint = request.cookies.get("reader_id")
     new_cookie = False
@@ -707,17 +792,13 @@ def render_blog_detail_page(slug):
     ip_address = (ip_header or "").split(",")[0].strip()
     if not ip_address or ip_address.lower() == "unknown":
         ip_address = request.remote_addr
-    geo = lookup_geo(ip_address)
     user_agent = request.headers.get("User-Agent")
     device = detect_device(user_agent)
 
     view = BlogView(
-        post=post,
+        post_id=current.id,
         fingerprint=fingerprint,
         ip_address=ip_address,
-        country=geo.get("country"),
-        city=geo.get("city"),
-        region=geo.get("region"),
         device=device,
         user_agent=user_agent,
         referrer=request.referrer,
@@ -728,15 +809,38 @@ def render_blog_detail_page(slug):
 
     db.session.add(view)
     db.session.commit()
-
-    response = make_response(
-        render_template(
-            "blog_detail.html",
-            post=post,
-            view_id=view.id,
-            reader_fingerprint=fingerprint,
-        )
-    )
+    reader_sketches.add(current.id, fingerprint)
+
+    version = (current.id, (current.updated_at or current.created_at or datetime.min).isoformat())
+    # The body only varies with the post version and its flushed view count;
+    # the per-visit view id travels in a cookie so 304s still record the view.
+    etag = compute_etag(version, current.view_count)
+    last_modified = last_modified_for(current.updated_at or current.created_at)
+    cacheable = cacheable_request()
+    response = not_modified(etag, last_modified) if cacheable else None
+    if response is None:
+        html_page = blog_page_cache.get(slug, version, request.host_url)
+        if html_page is None:
+            post = (
+                Post.query.options(selectinload(Post.tags), joinedload(Post.author))
+                .filter_by(id=current.id)
+                .first_or_404()
+            )
+            meta = meta_tags(
+                title=post.meta_title or post.title,
+                description=post.meta_description or post.excerpt,
+                keywords=post.meta_keywords,
+                url=url_for("home.blog_detail_public", slug=post.slug, _external=True),
+            )
+            html_page = render_template("blog_detail.html", post=post, meta=meta, view_count=VIEW_COUNT_PLACEHOLDER)
+            # Pages carrying flashed messages are one-off and must not be shared.
+            if cacheable:
+                blog_page_cache.set(slug, version, request.host_url, html_page)
+        response = make_response(fill_view_count(html_page, current.view_count or 0))
+        if cacheable:
+            apply_validators(response, etag, last_modified)
+
+    response.set_cookie(BLOG_VIEW_COOKIE, str(view.id), max_age=60 * 60, path=request.path, samesite="Lax")
     if new_cookie:
         response.set_cookie("reader_id", fingerprint, max_age=60 * 60 * 24 * 365, httponly=False, samesite="Lax")
     return response
@@ -750,30 +854,26 @@ def blog_detail(slug):
 
 @admin_bp.route("/blog/<slug>/track", methods=["POST"])
 def track_blog_read(slug):
-    post = Post.query.filter_by(slug=slug, is_published=True).first_or_404()
-    payload = request.get_json(silent=True) or {}
+    # Beacons may arrive as text/plain, so parse the body regardless of mimetype.
+    payload = request.get_json(silent=True, force=True) or {}
     view_id = payload.get("view_id")
     read_duration = payload.get("read_duration")
+    scroll_depth = payload.get("scroll_depth")
 
-    if not view_id:
+    if not isinstance(view_id, int) or isinstance(view_id, bool) or view_id <= 0:
         return jsonify({"status": "missing_view_id"}), 400
 
-    view = BlogView.query.filter_by(id=view_id, post_id=post.id).first()
-    if not view:
-        return jsonify({"status": "view_not_found"}), 404
-
-    updated = False
-    if isinstance(read_duration, (int, float)) and read_duration >= 0:
-        view.read_duration = int(read_duration)
-        updated = True
-
-    scroll_depth = payload.get("scroll_depth")
-    if isinstance(scroll_depth, (int, float)):
-        # store as referrer for now? better add column. For simplicity ignore but keep future.
-        pass
-
-    if updated:
-        view.updated_at = datetime.utcnow()
-        db.session.commit()
+    if not isinstance(read_duration, (int, float)) or read_duration < 0:
+        read_duration = None
+    if not isinstance(scroll_depth, (int, float)) or not 0 <= scroll_depth <= 100:
+        scroll_depth = None
+
+    if read_duration is not None or scroll_depth is not None:
+        read_heartbeats.record(
+            slug,
+            view_id,
+            read_duration=int(read_duration) if read_duration is not None else None,
+            scroll_depth=int(scroll_depth) if scroll_depth is not None else None,
+        )
 
-    return jsonify({"status": "ok"})
+    return "", 204
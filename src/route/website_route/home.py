@@ -1,8 +1,10 @@
-from flask import Blueprint, render_template, request, jsonify,redirect,url_for, make_response
-from datetime import datetime
+from flask import Blueprint, current_app, render_template, request, jsonify,redirect,url_for, make_response, abort
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from flask import flash
 from src.utils.seo import meta_tags
+from src.utils.sitemap import sitemap_builder
+from src.utils.conditional import conditional
+from src.utils.prerender import prerendered
 from src.route.admin_route.admin import (
     render_blog_list_page,
     render_blog_detail_page,
@@ -10,12 +12,14 @@ from src.route.admin_route.admin import (
 )
 
 
-from src.models.database import db, Lead, Post
+from src.models.database import db, Lead
+from src.utils.event_collector import MAX_BODY_BYTES, ingest_events, parse_events, validate_events
 
 home_bp = Blueprint('home', __name__, url_prefix='/')
 
 
 @home_bp.route('/')
+@prerendered
 def homepage():
     meta = meta_tags(
         title="Vertikal Agent – AI Agents for Every Business",
@@ -25,6 +29,7 @@ def homepage():
 
 
 @home_bp.route('/solution-core-agent')
+@prerendered
 def solution_core_agent():
     meta = meta_tags(
         title="Core AI Agent – Vertikal Agent",
@@ -34,6 +39,7 @@ def solution_core_agent():
 
 
 @home_bp.route('/solution-workflow-integration')
+@prerendered
 def solution_workflow_integration():
     meta = meta_tags(
         title="Workflow Integration Agent – Vertikal Agent",
@@ -43,6 +49,7 @@ def solution_workflow_integration():
 
 
 @home_bp.route('/solution-voice-agent')
+@prerendered
 def solution_voice_agent():
     meta = meta_tags(
         title="Voice Agent – Vertikal Agent",
@@ -52,6 +59,7 @@ def solution_voice_agent():
 
 
 @home_bp.route('/solution-custom-agent')
+@prerendered
 def solution_custom_agent():
     meta = meta_tags(
         title="Custom AI Agent – Vertikal Agent",
@@ -61,6 +69,7 @@ def solution_custom_agent():
 
 
 @home_bp.route('/solution-conversational-agent')
+@prerendered
 def solution_conversational_agent():
     meta = meta_tags(
         title="Conversational Dashboard – Vertikal Agent",
@@ -70,6 +79,7 @@ def solution_conversational_agent():
 
 
 @home_bp.route('/about')
+@prerendered
 def about_page():
     meta = meta_tags(
         title="About Vertikal Agent",
@@ -79,6 +89,7 @@ def about_page():
 
 
 @home_bp.route('/contact-us')
+@prerendered
 def contact_us():
     meta = meta_tags(
         title="Contact Vertikal Agent",
@@ -88,24 +99,28 @@ def contact_us():
 
 
 @home_bp.route('/privacy')
+@prerendered
 def privacy_policy():
     meta = meta_tags(title="Privacy Policy – Vertikal Agent", description="Read Vertikal Agent’s privacy policy.")
     return render_template('privacy.html', meta=meta)
 
 
 @home_bp.route('/terms')
+@prerendered
 def terms_of_service():
     meta = meta_tags(title="Terms of Service – Vertikal Agent", description="View Vertikal Agent’s terms of service.")
     return render_template('terms.html', meta=meta)
 
 
 @home_bp.route('/security')
+@prerendered
 def security_overview():
     meta = meta_tags(title="Security Overview – Vertikal Agent", description="See how Vertikal Agent keeps your data safe and secure.")
     return render_template('security.html', meta=meta)
 
 
 @home_bp.route('/robots.txt')
+@conditional()
 def robots_txt():
     lines = [
         "User-agent: *",
@@ -119,50 +134,31 @@ def robots_txt():
 
 @home_bp.route('/sitemap.xml')
 def sitemap_xml():
-    pages = []
-    ten_days_ago = (datetime.utcnow()).date().isoformat()
-    routes = [
-        ('home.homepage', {}),
-        ('home.about_page', {}),
-        ('home.solution_core_agent', {}),
-        ('home.solution_workflow_integration', {}),
-        ('home.solution_conversational_agent', {}),
-        ('home.solution_custom_agent', {}),
-        ('home.solution_voice_agent', {}),
-        ('home.contact_us', {}),
-        ('home.privacy_policy', {}),
-        ('home.terms_of_service', {}),
-        ('home.security_overview', {}),
-        ('home.blog_listing', {}),
-    ]
-    for endpoint, params in routes:
-        pages.append({
-            "loc": url_for(endpoint, _external=True, **params),
-            "lastmod": ten_days_ago,
-        })
-
-    posts = Post.query.filter_by(is_published=True).order_by(Post.updated_at.desc(), Post.created_at.desc()).all()
-    for post in posts:
-        lastmod_dt = post.updated_at or post.created_at or datetime.utcnow()
-        pages.append({
-            "loc": url_for('home.blog_detail_public', slug=post.slug, _external=True),
-            "lastmod": lastmod_dt.date().isoformat(),
-        })
-
-    xml_parts = [
-        "<?xml version='1.0' encoding='UTF-8'?>",
-        "<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>",
-    ]
-    for page in pages:
-        xml_parts.append("  <url>")
-        xml_parts.append(f"    <loc>{page['loc']}</loc>")
-        xml_parts.append(f"    <lastmod>{page['lastmod']}</lastmod>")
-        xml_parts.append("  </url>")
-    xml_parts.append("</urlset>")
-
-    response = make_response("\n".join(xml_parts))
+    return _sitemap_response(sitemap_builder.document(request.host_url))
+
+
+@home_bp.route('/sitemap-<int:part>.xml')
+def sitemap_part(part):
+    document = sitemap_builder.document(request.host_url, part)
+    if document is None:
+        abort(404)
+    return _sitemap_response(document)
+
+
+def _sitemap_response(document):
+    if request.accept_encodings["gzip"]:
+        response = make_response(document.gzip_body)
+        response.headers["Content-Encoding"] = "gzip"
+        response.set_etag(f"{document.etag}-gz")
+    else:
+        response = make_response(document.body)
+        response.set_etag(document.etag)
     response.headers["Content-Type"] = "application/xml"
-    return response
+    response.vary.add("Accept-Encoding")
+    response.last_modified = document.last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
 
 
 @home_bp.route('/blog')
@@ -181,6 +177,28 @@ def blog_detail_track_public(slug):
 
 
 
+@home_bp.route('/collect', methods=['POST'])
+def collect_events():
+    # Checked before reading, so an oversized or unsized (chunked) body is never buffered.
+    if request.content_length is None or request.content_length > MAX_BODY_BYTES:
+        return jsonify({"status": "payload_too_large"}), 413
+    body = request.get_data(cache=False)
+
+    try:
+        raw_events = parse_events(body)
+    except ValueError:
+        return jsonify({"status": "invalid_payload"}), 400
+
+    ingest_events(
+        validate_events(raw_events),
+        ip_address=request.headers.get("X-Forwarded-For", request.remote_addr),
+        user_agent=request.headers.get("User-Agent"),
+        fingerprint=request.cookies.get("reader_id"),
+        accept_pageviews=current_app.config.get("VISITOR_LOG_SOURCE") == "client",
+    )
+    return "", 204
+
+
 @home_bp.route('/contact/lead', methods=['POST'])
 def create_lead():
     payload = request.form
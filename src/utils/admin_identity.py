@@ -0,0 +1,67 @@
+import hashlib
+import multiprocessing
+from collections import namedtuple
+
+from src.models.database import db, User
+from src.utils.cache import TTLCache
+
+SESSION_STAMP_KEY = "admin_identity_stamp"
+
+# Detached snapshot of the fields admin views and templates read off the current user.
+AdminIdentity = namedtuple("AdminIdentity", ["id", "name", "email", "role", "profile_image", "stamp"])
+
+
+def identity_stamp(user):
+    """Changes whenever the user's role or password does; kept in the signed session cookie."""
+    raw = f"{user.id}|{user.role}|{user.password_hash}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def identity_for(user):
+    return AdminIdentity(user.id, user.name, user.email, user.role, user.profile_image, identity_stamp(user))
+
+
+class AdminIdentityCache:
+    """
+    Per-process cache of signed-in admins, so most admin requests skip the users table.
+
+    An entry is used only while it is younger than ``ADMIN_IDENTITY_TTL``, its
+    stamp matches the one in the session, and no user has been invalidated
+    since it was cached. The invalidation generation lives in shared memory
+    created before gunicorn forks (``--preload``), so ``edit_user`` and
+    ``delete_user`` in one worker take effect in all of them at once; without
+    a shared parent the TTL bounds how long other processes lag.
+    """
+
+    def __init__(self, maxsize=1000, ttl=30):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generation = multiprocessing.Value("L", 0)
+
+    def init_app(self, app):
+        self._cache.ttl = float(app.config.get("ADMIN_IDENTITY_TTL", self._cache.ttl))
+
+    def resolve(self, user_id, stamp=None):
+        """``AdminIdentity`` for ``user_id``, or ``None`` if the user no longer exists."""
+        generation = self._generation.value
+        entry = self._cache.get(user_id)
+        if entry is not None and entry[0] == generation and entry[1].stamp == stamp:
+            return entry[1]
+
+        user = db.session.get(User, user_id)
+        if user is None:
+            self._cache.delete(user_id)
+            return None
+        identity = identity_for(user)
+        self._cache.set(user_id, (generation, identity))
+        return identity
+
+    def invalidate(self, user_id):
+        with self._generation.get_lock():
+            self._generation.value += 1
+        self._cache.delete(user_id)
+
+    def clear(self):
+        self._cache.clear()
+
+
+admin_identities = AdminIdentityCache()
@@ -0,0 +1,51 @@
+from sqlalchemy import func, select
+
+from src.models.database import db, BlogView
+
+
+def post_read_stats(post_ids=None):
+    """
+    Per-post read analytics computed with grouped aggregates in the database.
+
+    Returns ``{post_id: {total_reads, avg_read_time, top_location}}``
+    using two queries regardless of how many posts or views exist. Unique
+    readers come from the HyperLogLog sketches in ``reader_sketches``.
+    """
+    totals = select(
+        BlogView.post_id,
+        func.count().label("total_reads"),
+        func.sum(func.coalesce(BlogView.read_duration, 0)).label("total_duration"),
+    ).group_by(BlogView.post_id)
+
+    country = func.coalesce(BlogView.country, "Unknown")
+    city = func.coalesce(BlogView.city, "")
+    ranked = select(
+        BlogView.post_id,
+        country.label("country"),
+        city.label("city"),
+        func.row_number()
+        .over(partition_by=BlogView.post_id, order_by=(func.count().desc(), country, city))
+        .label("position"),
+    ).group_by(BlogView.post_id, country, city)
+
+    if post_ids is not None:
+        totals = totals.where(BlogView.post_id.in_(post_ids))
+        ranked = ranked.where(BlogView.post_id.in_(post_ids))
+
+    ranked = ranked.subquery()
+    top_locations = {
+        row.post_id: f"{row.city}, {row.country}" if row.city else row.country
+        for row in db.session.execute(
+            select(ranked.c.post_id, ranked.c.country, ranked.c.city).where(ranked.c.position == 1)
+        )
+    }
+
+    stats = {}
+    for row in db.session.execute(totals):
+        total_reads = row.total_reads or 0
+        stats[row.post_id] = {
+            "total_reads": total_reads,
+            "avg_read_time": round(float(row.total_duration or 0) / total_reads, 1) if total_reads else 0,
+            "top_location": top_locations.get(row.post_id, "—"),
+        }
+    return stats
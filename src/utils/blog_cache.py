@@ -0,0 +1,53 @@
+from src.utils.cache import TTLCache
+
+# The view count is rendered as this token and substituted after lookup.
+VIEW_COUNT_PLACEHOLDER = "__VERTIKAL_VIEW_COUNT__"
+# Read by the page's tracking script; scoped to the post's path.
+BLOG_VIEW_COOKIE = "blog_view_id"
+
+
+class RenderedPageCache:
+    """
+    Rendered blog detail HTML keyed by slug, post version and host.
+
+    The version is cheap to read (``posts.id`` + ``updated_at``), so a worker
+    never serves HTML older than the row it just looked up; ``invalidate`` lets
+    the admin write paths drop stale entries from this worker right away.
+    """
+
+    def __init__(self, maxsize=500, ttl=60 * 60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def init_app(self, app):
+        self._cache = TTLCache(
+            maxsize=int(app.config.get("BLOG_PAGE_CACHE_SIZE", self._cache.maxsize)),
+            ttl=float(app.config.get("BLOG_PAGE_CACHE_TTL", self._cache.ttl)),
+        )
+
+    def get(self, slug, version, host):
+        entry = self._cache.get(slug)
+        if not entry or entry["version"] != version:
+            return None
+        return entry["pages"].get(host)
+
+    def set(self, slug, version, host, html):
+        entry = self._cache.get(slug)
+        if not entry or entry["version"] != version:
+            entry = {"version": version, "pages": {}}
+            self._cache.set(slug, entry)
+        entry["pages"][host] = html
+
+    def invalidate(self, *slugs):
+        for slug in slugs:
+            if slug:
+                self._cache.delete(slug)
+
+    def clear(self):
+        self._cache.clear()
+
+
+def fill_view_count(html, view_count):
+    return html.replace(VIEW_COUNT_PLACEHOLDER, str(view_count))
+
+
+blog_page_cache = RenderedPageCache()
@@ -0,0 +1,232 @@
+import gzip
+import itertools
+import logging
+import os
+import zlib
+
+from werkzeug.datastructures import Headers
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/rss+xml",
+    "application/manifest+json",
+    "image/svg+xml",
+)
+STATIC_EXTENSIONS = (".css", ".js", ".mjs", ".map", ".json", ".svg", ".html", ".txt", ".xml", ".webmanifest")
+# Suffixes of precompressed siblings, in server preference order.
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _is_compressible(content_type):
+    mimetype = (content_type or "").split(";", 1)[0].strip().lower()
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def _accepted_encodings(environ):
+    """Client-accepted codings from ``Accept-Encoding`` that have a non-zero quality."""
+    accepted = set()
+    for item in environ.get("HTTP_ACCEPT_ENCODING", "").lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip())
+    return accepted
+
+
+class _GzipStream:
+    def __init__(self, level):
+        # wbits=31 writes a gzip container around the deflate stream.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk):
+        return self._compressor.compress(chunk)
+
+    def sync(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk):
+        return self._compressor.process(chunk)
+
+    def sync(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    WSGI middleware that gzip/brotli-encodes compressible responses.
+
+    Responses with a ``Content-Length`` are compressed whole once they reach
+    ``min_size`` bytes. Responses without one (``stream_with_context``
+    generators such as ``/api/agent/chat``) are compressed chunk by chunk
+    with a sync flush after each, so the client still receives every chunk
+    as soon as the app yields it. Already-encoded responses (prerendered
+    pages, precompressed static files) pass through untouched.
+    """
+
+    def __init__(self, app, min_size=1024, level=6, brotli_quality=5):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+        self.brotli_quality = brotli_quality
+
+    def _choose_encoding(self, environ):
+        accepted = _accepted_encodings(environ)
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def __call__(self, environ, start_response):
+        encoding = None if environ.get("REQUEST_METHOD") == "HEAD" else self._choose_encoding(environ)
+        if encoding is None:
+            return self.app(environ, start_response)
+
+        captured = {}
+        buffered = []
+
+        def capture(status, headers, exc_info=None):
+            captured["status"], captured["headers"], captured["exc_info"] = status, headers, exc_info
+            return buffered.append
+
+        body = self.app(environ, capture)
+        headers = Headers(captured["headers"])
+
+        if not self._should_compress(captured["status"], headers):
+            start_response(captured["status"], headers.to_wsgi_list(), captured["exc_info"])
+            return self._passthrough(buffered, body)
+
+        streaming = "Content-Length" not in headers
+        if not streaming:
+            try:
+                content = b"".join(buffered) + b"".join(body)
+            finally:
+                if hasattr(body, "close"):
+                    body.close()
+            stream = self._stream(encoding)
+            content = stream.compress(content) + stream.finish()
+            headers["Content-Length"] = str(len(content))
+
+        headers["Content-Encoding"] = encoding
+        vary = headers.get("Vary")
+        if not vary:
+            headers["Vary"] = "Accept-Encoding"
+        elif "accept-encoding" not in vary.lower():
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            # Still matches If-None-Match (weak comparison) but no longer claims byte equality.
+            headers["ETag"] = f"W/{etag}"
+
+        start_response(captured["status"], headers.to_wsgi_list(), captured["exc_info"])
+        if not streaming:
+            return [content]
+        return self._compress_stream(self._stream(encoding), buffered, body)
+
+    def _should_compress(self, status, headers):
+        if not status.startswith("200"):
+            return False
+        if "Content-Encoding" in headers or "no-transform" in headers.get("Cache-Control", ""):
+            return False
+        if not _is_compressible(headers.get("Content-Type")):
+            return False
+        length = headers.get("Content-Length")
+        return length is None or int(length) >= self.min_size
+
+    def _stream(self, encoding):
+        return _BrotliStream(self.brotli_quality) if encoding == "br" else _GzipStream(self.level)
+
+    @staticmethod
+    def _passthrough(buffered, body):
+        if not buffered:
+            return body
+
+        def chained():
+            try:
+                yield from buffered
+                yield from body
+            finally:
+                if hasattr(body, "close"):
+                    body.close()
+
+        return chained()
+
+    @staticmethod
+    def _compress_stream(stream, buffered, body):
+        try:
+            for chunk in itertools.chain(buffered, body):
+                if chunk:
+                    yield stream.compress(chunk) + stream.sync()
+            yield stream.finish()
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+
+
+def init_compression(app):
+    """Wrap ``app.wsgi_app`` in :class:`CompressionMiddleware`."""
+    if not app.config.get("COMPRESSION_ENABLED", True):
+        return
+    app.wsgi_app = CompressionMiddleware(
+        app.wsgi_app,
+        min_size=int(app.config.get("COMPRESSION_MIN_SIZE", 1024)),
+        level=int(app.config.get("COMPRESSION_LEVEL", 6)),
+    )
+
+
+def precompress_static(static_folder, min_size=1024):
+    """Write ``.gz`` (and ``.br`` when available) siblings for text assets; returns files written."""
+    if brotli is None:
+        logger.warning("brotli is not installed; writing .gz siblings only")
+    written = 0
+    for root, _, files in os.walk(static_folder):
+        for name in files:
+            if not name.lower().endswith(STATIC_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            if os.path.getsize(path) < min_size:
+                continue
+            with open(path, "rb") as source:
+                data = source.read()
+            targets = [(".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                targets.append((".br", lambda raw: brotli.compress(raw, quality=11)))
+            for suffix, compress in targets:
+                target = path + suffix
+                if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                    continue
+                compressed = compress(data)
+                if len(compressed) >= len(data):
+                    continue
+                with open(target, "wb") as handle:
+                    handle.write(compressed)
+                written += 1
+                logger.info("Precompressed %s (%s -> %s bytes)", target, len(data), len(compressed))
+    return written
@@ -0,0 +1,112 @@
+import hashlib
+import os
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+from sqlalchemy import func, select
+from werkzeug.http import is_resource_modified
+
+from src.models.database import db, Post
+
+_template_versions = {}
+
+
+def template_version():
+    """
+    Newest mtime under the app's template folder.
+
+    Pages extend ``base.html`` and include partials, so any template edit
+    changes every page's validator. Computed once per process outside debug,
+    where templates only change with a deploy.
+    """
+    app = current_app._get_current_object()
+    cached = _template_versions.get(app.name)
+    if cached is not None and not app.debug:
+        return cached
+    newest = 0.0
+    for root, _, files in os.walk(os.path.join(app.root_path, app.template_folder)):
+        for name in files:
+            newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    _template_versions[app.name] = newest
+    return newest
+
+
+def published_posts_version():
+    """``(count, newest timestamp)`` of published posts: changes on publish, edit and delete."""
+    return db.session.execute(
+        select(func.count(Post.id), func.max(func.coalesce(Post.updated_at, Post.created_at)))
+        .where(Post.is_published.is_(True))
+    ).one()
+
+
+def compute_etag(*parts):
+    """Strong ETag for everything a response body depends on besides ``parts``: URL and templates."""
+    seed = repr((request.url, template_version(), parts)).encode("utf-8")
+    return hashlib.sha1(seed).hexdigest()
+
+
+def last_modified_for(*timestamps):
+    """Latest of the given naive-UTC datetimes and the template mtime, for ``Last-Modified``."""
+    newest = datetime.fromtimestamp(template_version(), tz=timezone.utc).replace(microsecond=0)
+    for value in timestamps:
+        if value is not None:
+            newest = max(newest, value.replace(tzinfo=timezone.utc, microsecond=0))
+    return newest
+
+
+def cacheable_request():
+    """
+    Whether validators may be used for this request.
+
+    Flashed messages render into the page once (and are consumed by the
+    render), so check this before the view runs.
+    """
+    return request.method in ("GET", "HEAD") and "_flashes" not in session
+
+
+def not_modified(etag, last_modified=None):
+    """A 304 response if the client's validators match, otherwise ``None``."""
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+    response = make_response("", 304)
+    apply_validators(response, etag, last_modified)
+    return response
+
+
+def apply_validators(response, etag, last_modified=None):
+    if response.status_code not in (200, 304):
+        return response
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Browsers revalidate every time; unchanged pages cost one cheap 304.
+    response.cache_control.no_cache = True
+    return response
+
+
+def conditional(version=None):
+    """
+    Serve ``304 Not Modified`` for a view before it renders anything.
+
+    ``version`` is an optional callable taking the view's arguments and
+    returning ``(parts, last_modified)`` for data the page depends on;
+    template mtimes and the request URL are always part of the ETag.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if not cacheable_request():
+                return view(*args, **kwargs)
+            parts, modified = version(*args, **kwargs) if version else ((), None)
+            etag = compute_etag(request.endpoint, parts)
+            last_modified = last_modified_for(modified)
+            cached = not_modified(etag, last_modified)
+            if cached is not None:
+                return cached
+            return apply_validators(make_response(view(*args, **kwargs)), etag, last_modified)
+
+        return wrapped
+
+    return decorator
@@ -0,0 +1,39 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+from src.models.database import db, Message
+
+
+def latest_messages_query():
+    """
+    ``select(Message)`` of each lead's newest message, lead joined in.
+
+    One ``row_number()`` window over ``ix_message_lead_created`` picks the
+    newest row per lead, so the conversation list never touches messages
+    row by row and never lazy-loads a lead.
+    """
+    ranked = select(
+        Message.id,
+        func.row_number().over(
+            partition_by=Message.lead_id,
+            order_by=(Message.created_at.desc(), Message.id.desc()),
+        ).label("position"),
+    ).subquery()
+    return (
+        select(Message)
+        .join(ranked, ranked.c.id == Message.id)
+        .where(ranked.c.position == 1)
+        .options(joinedload(Message.lead))
+    )
+
+
+def thread_sizes(lead_ids):
+    """``{lead_id: message count}`` for the given leads, in one grouped query."""
+    if not lead_ids:
+        return {}
+    rows = db.session.execute(
+        select(Message.lead_id, func.count())
+        .where(Message.lead_id.in_(lead_ids))
+        .group_by(Message.lead_id)
+    )
+    return dict(rows.all())
@@ -0,0 +1,317 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, delete, event, func, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.models.database import db, DashboardCounter, Lead, Message, Post, User, VisitorLog
+from src.utils.write_behind import BackgroundFlusher, analytics_writer
+
+# Daily counters older than this are pruned on reconcile.
+DAILY_RETENTION_DAYS = 7
+SESSION_DELTAS_KEY = "dashboard_counter_deltas"
+# Counter row holding how many times the counters have been reconciled; its
+# updated_at is when the last reconcile started counting.
+EPOCH_KEY = "reconcile:epoch"
+
+
+def daily_key(name, day=None):
+    return f"{name}:{(day or datetime.utcnow().date()).isoformat()}"
+
+
+def _day_bounds(day):
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+def _count(model, *criteria):
+    return db.session.scalar(select(func.count()).select_from(model).where(*criteria)) or 0
+
+
+def _daily_count(model, day):
+    start, end = _day_bounds(day)
+    return _count(model, model.created_at >= start, model.created_at < end)
+
+
+def true_counts(days=2):
+    """
+    ``{key: value}`` recomputed from the source tables.
+
+    Totals come from one COUNT each (leads by status from one GROUP BY);
+    daily counters are recomputed for the last ``days`` days only.
+    """
+    counts = {
+        "posts": _count(Post),
+        "posts:published": _count(Post, Post.is_published.is_(True)),
+        "users": _count(User),
+        "leads": _count(Lead),
+    }
+    for status, value in db.session.execute(select(Lead.status, func.count()).group_by(Lead.status)):
+        counts[f"leads:status:{status}"] = value
+    today = datetime.utcnow().date()
+    for offset in range(days):
+        day = today - timedelta(days=offset)
+        counts[daily_key("leads", day)] = _daily_count(Lead, day)
+        counts[daily_key("messages", day)] = _daily_count(Message, day)
+        counts[daily_key("visitors", day)] = _daily_count(VisitorLog, day)
+    return counts
+
+
+def _created_day(instance):
+    return (instance.created_at or datetime.utcnow()).date()
+
+
+def _row_keys(instance):
+    """Counter keys a row of a tracked model contributes 1 to."""
+    if isinstance(instance, Post):
+        return ["posts", "posts:published"] if instance.is_published else ["posts"]
+    if isinstance(instance, User):
+        return ["users"]
+    if isinstance(instance, Lead):
+        return ["leads", f"leads:status:{instance.status or 'new'}", daily_key("leads", _created_day(instance))]
+    if isinstance(instance, Message):
+        return [daily_key("messages", _created_day(instance))]
+    return []
+
+
+def _changed_keys(instance, deltas):
+    """Move counts between keys when a tracked attribute changes on update."""
+    if isinstance(instance, Lead):
+        attribute, key_for = "status", lambda value: f"leads:status:{value}"
+    elif isinstance(instance, Post):
+        attribute, key_for = "is_published", lambda value: "posts:published" if value else None
+    else:
+        return
+    history = inspect(instance).attrs[attribute].history
+    if not history.has_changes():
+        return
+    for value in history.deleted:
+        if key_for(value):
+            deltas[key_for(value)] -= 1
+    for value in history.added:
+        if key_for(value):
+            deltas[key_for(value)] += 1
+
+
+class DashboardCounters(BackgroundFlusher):
+    """
+    Admin dashboard totals, maintained incrementally and served from memory.
+
+    ORM commits on any session (web, CLI, agent tools) feed per-process
+    deltas, which are applied to ``dashboard_counters`` as one batched
+    UPDATE per interval, the same way ``ViewCounter`` handles view counts.
+    Visitor rows are counted once their write-behind batch has committed.
+    Reads come from a snapshot of that small table that is refreshed every
+    ``cache_ttl`` seconds.
+
+    ``flask reconcile-counters`` (run from cron) recomputes the counters from
+    the source tables, correcting drift from crashes, raw SQL or processes
+    without a flusher, and bumps a reconcile epoch. Deltas carry their commit
+    time and are dropped if they were committed before the last reconcile
+    started, because the recount already includes their rows. Until the
+    first reconcile the counters are not trusted: deltas are dropped and
+    ``snapshot()`` counts the source tables instead.
+    """
+
+    def __init__(self, name="dashboard-counters", interval=5.0, cache_ttl=5.0):
+        super().__init__(name, interval=interval)
+        self.cache_ttl = cache_ttl
+        self._pending = []  # [(committed_at, Counter)]
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._snapshot_at = 0.0
+
+    def init_app(self, app):
+        self.interval = float(app.config.get("DASHBOARD_COUNTER_FLUSH_INTERVAL", self.interval))
+        self.cache_ttl = float(app.config.get("DASHBOARD_COUNTER_CACHE_TTL", self.cache_ttl))
+        super().init_app(app)
+
+    def _reset_after_fork(self):
+        self._pending = []
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    def add(self, key, amount=1):
+        self.add_many({key: amount})
+
+    def add_many(self, deltas):
+        # Processes without an app (e.g. the LiveKit worker) never flush; reconcile covers them.
+        if self.app is None:
+            return
+        self.ensure_started()
+        committed_at = datetime.utcnow()
+        with self._lock:
+            self._pending.append((committed_at, Counter(deltas)))
+
+    def _drain(self):
+        with self._lock:
+            batches, self._pending = self._pending, []
+        if not batches:
+            return
+        try:
+            self._apply(batches)
+        except Exception:
+            with self._lock:
+                self._pending[:0] = batches
+            raise
+
+    def _last_reconcile(self):
+        # Row-locked, so a flush waits for a running reconcile and then sees its start time.
+        return db.session.execute(
+            select(DashboardCounter.value, DashboardCounter.updated_at)
+            .where(DashboardCounter.key == EPOCH_KEY)
+            .with_for_update()
+        ).first()
+
+    @staticmethod
+    def _since(batches, reconciled_at):
+        """Sum the batches committed at or after ``reconciled_at``; earlier ones are in its counts."""
+        deltas = Counter()
+        if reconciled_at is not None:
+            for committed_at, batch in batches:
+                if committed_at >= reconciled_at:
+                    deltas.update(batch)
+        return {key: amount for key, amount in deltas.items() if amount}
+
+    def _apply(self, batches):
+        last = self._last_reconcile()
+        deltas = self._since(batches, last.updated_at if last else None)
+        if not deltas:
+            db.session.commit()
+            return
+
+        now = datetime.utcnow()
+        existing = set(db.session.scalars(select(DashboardCounter.key).where(DashboardCounter.key.in_(list(deltas)))))
+        if existing:
+            db.session.execute(
+                update(DashboardCounter)
+                .where(DashboardCounter.key.in_(list(existing)))
+                .values(
+                    value=DashboardCounter.value + case(
+                        {key: deltas[key] for key in existing}, value=DashboardCounter.key, else_=0
+                    ),
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        missing = set(deltas) - existing
+        if missing:
+            # A key with no row yet (a new day or status) had no rows at the last reconcile.
+            db.session.execute(
+                insert(DashboardCounter),
+                [{"key": key, "value": deltas[key], "updated_at": now} for key in missing],
+            )
+        # An IntegrityError (another worker inserted the key first) re-queues the deltas for the next flush.
+        db.session.commit()
+
+    def reconcile(self):
+        """
+        Overwrite every counter with its true value, prune old daily rows and
+        start a new epoch; returns the counts. Meant for the CLI, not requests.
+        """
+        last = self._last_reconcile()
+        # Taken before counting: deltas committed from here on are applied on top of these counts.
+        now = datetime.utcnow()
+        counts = true_counts()
+        existing = set(db.session.scalars(select(DashboardCounter.key)))
+        oldest = (datetime.utcnow() - timedelta(days=DAILY_RETENTION_DAYS)).date().isoformat()
+        expired = []
+        for key in existing - set(counts) - {EPOCH_KEY}:
+            if key.startswith("leads:status:"):
+                counts[key] = 0  # no leads left in that status
+            elif key.rsplit(":", 1)[-1] < oldest:
+                expired.append(key)
+
+        values = {**counts, EPOCH_KEY: (last.value if last else 0) + 1}
+        rows = [{"key": key, "value": value, "updated_at": now} for key, value in values.items()]
+        try:
+            if expired:
+                db.session.execute(delete(DashboardCounter).where(DashboardCounter.key.in_(expired)))
+            if existing & set(values):
+                db.session.execute(update(DashboardCounter), [row for row in rows if row["key"] in existing])
+            if set(values) - existing:
+                db.session.execute(insert(DashboardCounter), [row for row in rows if row["key"] not in existing])
+            db.session.commit()
+        except IntegrityError:
+            # Another process reconciled into the empty table first; its values are just as fresh.
+            db.session.rollback()
+        self._snapshot = None
+        return counts
+
+    def snapshot(self):
+        """
+        ``{key: value}`` for all counters, this process's unflushed deltas included.
+
+        Before the first reconcile this counts the source tables instead, read-only.
+        """
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot_at >= self.cache_ttl:
+            counts, reconciled_at = {}, None
+            for key, value, updated_at in db.session.execute(
+                select(DashboardCounter.key, DashboardCounter.value, DashboardCounter.updated_at)
+            ):
+                if key == EPOCH_KEY:
+                    reconciled_at = updated_at
+                else:
+                    counts[key] = value
+            self._snapshot = (reconciled_at, counts if reconciled_at is not None else true_counts())
+            self._snapshot_at = now
+        reconciled_at, stored = self._snapshot
+        counts = dict(stored)
+        if reconciled_at is None:
+            return counts
+        with self._lock:
+            batches = list(self._pending)
+        for key, amount in self._since(batches, reconciled_at).items():
+            counts[key] = counts.get(key, 0) + amount
+        return counts
+
+
+dashboard_counters = DashboardCounters()
+
+
+def _count_written_rows(table_name, rows):
+    # Write-behind rows bypass the ORM; count them once their batch has committed.
+    if table_name == VisitorLog.__tablename__:
+        dashboard_counters.add_many(Counter(
+            daily_key("visitors", (row.get("created_at") or datetime.utcnow()).date()) for row in rows
+        ))
+
+
+analytics_writer.on_commit(_count_written_rows)
+
+
+# Load the previous value when these are assigned on an expired instance, so
+# the flush history has something to move the count away from.
+@event.listens_for(Lead.status, "set", active_history=True)
+@event.listens_for(Post.is_published, "set", active_history=True)
+def _track_previous_value(target, value, oldvalue, initiator):
+    return value
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_counter_deltas(session, flush_context):
+    deltas = session.info.setdefault(SESSION_DELTAS_KEY, Counter())
+    for instance in session.new:
+        for key in _row_keys(instance):
+            deltas[key] += 1
+    for instance in session.deleted:
+        for key in _row_keys(instance):
+            deltas[key] -= 1
+    for instance in session.dirty:
+        _changed_keys(instance, deltas)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_counter_deltas(session):
+    deltas = session.info.pop(SESSION_DELTAS_KEY, None)
+    if deltas:
+        dashboard_counters.add_many(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_counter_deltas(session):
+    session.info.pop(SESSION_DELTAS_KEY, None)
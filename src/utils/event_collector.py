@@ -0,0 +1,163 @@
+import json
+from datetime import datetime
+
+from src.models.database import ClientEvent, VisitorLog
+from src.utils.read_tracker import read_heartbeats
+from src.utils.write_behind import analytics_writer
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_EVENTS_PER_BATCH = 100
+
+UTM_FIELDS = ("utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content")
+
+# field -> (kind, limit, required). ``str`` limits are max lengths, numeric limits
+# are (min, max) ranges.
+EVENT_SCHEMAS = {
+    "pageview": {
+        "path": (str, 200, True),
+        "referrer": (str, 500, False),
+        **{field: (str, 100, False) for field in UTM_FIELDS},
+    },
+    "read": {
+        "slug": (str, 255, True),
+        "view_id": (int, (1, None), True),
+        "read_duration": (float, (0, 24 * 60 * 60), True),
+        "scroll_depth": (float, (0, 100), False),
+    },
+    "scroll": {
+        "slug": (str, 255, True),
+        "view_id": (int, (1, None), True),
+        "scroll_depth": (float, (0, 100), True),
+    },
+    "cta_click": {
+        "path": (str, 200, True),
+        "label": (str, 120, False),
+        "target": (str, 500, False),
+    },
+}
+
+
+def _compile_field(kind, limit):
+    if kind is str:
+        def check(value):
+            if not isinstance(value, str):
+                raise ValueError
+            return value.strip()[:limit] or None
+        return check
+
+    low, high = limit
+
+    def check(value):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError
+        if kind is int and value != int(value):
+            raise ValueError
+        if (low is not None and value < low) or (high is not None and value > high):
+            raise ValueError
+        return int(value)
+    return check
+
+
+def _compile_schema(fields):
+    compiled = tuple(
+        (name, _compile_field(kind, limit), required)
+        for name, (kind, limit, required) in fields.items()
+    )
+
+    def validate(event):
+        cleaned = {}
+        for name, check, required in compiled:
+            value = event.get(name)
+            if value is None:
+                if required:
+                    return None
+                continue
+            try:
+                cleaned[name] = check(value)
+            except ValueError:
+                return None
+            if required and cleaned[name] is None:
+                return None
+        return cleaned
+    return validate
+
+
+# Validators are built once at import, not per request.
+VALIDATORS = {event_type: _compile_schema(fields) for event_type, fields in EVENT_SCHEMAS.items()}
+
+
+def parse_events(body):
+    """Decode a JSON array, ``{"events": [...]}``, a single object, or NDJSON."""
+    text = body.decode("utf-8", errors="replace").strip()
+    if not text:
+        return []
+    try:
+        decoded = json.loads(text)
+    except ValueError:
+        decoded = []
+        for line in text.splitlines():
+            if line.strip():
+                decoded.append(json.loads(line))
+    if isinstance(decoded, dict):
+        decoded = decoded.get("events", [decoded])
+    if not isinstance(decoded, list):
+        raise ValueError("expected a list of events")
+    return decoded[:MAX_EVENTS_PER_BATCH]
+
+
+def validate_events(raw_events):
+    valid = []
+    for event in raw_events:
+        if not isinstance(event, dict):
+            continue
+        event_type = event.get("type")
+        validator = VALIDATORS.get(event_type)
+        if validator is None:
+            continue
+        cleaned = validator(event)
+        if cleaned is not None:
+            cleaned["type"] = event_type
+            valid.append(cleaned)
+    return valid
+
+
+def ingest_events(events, ip_address=None, user_agent=None, fingerprint=None, accept_pageviews=False):
+    """
+    Hand validated events to the write-behind pipeline; never touches the DB.
+
+    ``pageview`` events are dropped unless ``accept_pageviews`` is set
+    (``VISITOR_LOG_SOURCE=client``); otherwise ``log_visitor`` already
+    records those page loads.
+    """
+    now = datetime.utcnow()
+    for event in events:
+        event_type = event["type"]
+        if event_type == "pageview":
+            if not accept_pageviews:
+                continue
+            analytics_writer.submit(VisitorLog, {
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "referrer": event.get("referrer"),
+                "path": event["path"],
+                **{field: event.get(field) for field in UTM_FIELDS},
+                "created_at": now,
+            })
+        elif event_type in ("read", "scroll"):
+            read_heartbeats.record(
+                event["slug"],
+                event["view_id"],
+                read_duration=event.get("read_duration"),
+                scroll_depth=event.get("scroll_depth"),
+            )
+        elif event_type == "cta_click":
+            analytics_writer.submit(ClientEvent, {
+                "event_type": event_type,
+                "path": event["path"],
+                "label": event.get("label"),
+                "target": event.get("target"),
+                "fingerprint": fingerprint,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "created_at": now,
+            })
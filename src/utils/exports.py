@@ -0,0 +1,163 @@
+import csv
+import io
+import json
+import re
+import zlib
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select
+
+from src.models.database import db, BlogView, Lead, Message, VisitorLog
+from src.utils.lead_filters import LeadFilters, filter_leads
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+DEFAULT_BATCH_SIZE = 1000
+# Cells starting with these are evaluated as formulas by spreadsheet apps.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# International phone numbers start with "+" but cannot hold a formula.
+PHONE_NUMBER = re.compile(r"\+[\d\s()-]+")
+
+
+def _filter_by_columns(spec, query, since, until, filters):
+    model = spec.model
+    for name, value in filters.items():
+        column = getattr(model, name)
+        # Raises ValueError for e.g. a non-numeric post_id.
+        query = query.where(column == column.type.python_type(value))
+    if since:
+        query = query.where(model.created_at >= datetime.combine(since, datetime.min.time()))
+    if until:
+        query = query.where(model.created_at < datetime.combine(until + timedelta(days=1), datetime.min.time()))
+    return query
+
+
+def _filter_leads(spec, query, since, until, filters):
+    return filter_leads(query, LeadFilters(
+        status=filters.get("status"),
+        source=filters.get("source"),
+        intent=filters.get("intent"),
+        since=since,
+        until=until,
+        q=filters.get("q"),
+    ))
+
+
+# ``filters`` lists the query arguments accepted besides ``since``/``until``.
+ExportSpec = namedtuple("ExportSpec", ["model", "columns", "filters", "apply"])
+
+EXPORTS = {
+    "leads": ExportSpec(
+        Lead,
+        ("id", "created_at", "updated_at", "name", "email", "phone", "industry", "source", "intent",
+         "status", "form_type", "source_page", "problem", "message", "summary"),
+        ("status", "source", "intent", "q"),
+        _filter_leads,
+    ),
+    "messages": ExportSpec(
+        Message,
+        ("id", "created_at", "lead_id", "direction", "content"),
+        ("lead_id", "direction"),
+        _filter_by_columns,
+    ),
+    "visitors": ExportSpec(
+        VisitorLog,
+        ("id", "created_at", "ip_address", "country", "city", "path", "referrer", "user_agent",
+         "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content"),
+        ("path", "country", "utm_source", "utm_medium", "utm_campaign"),
+        _filter_by_columns,
+    ),
+    "blog-views": ExportSpec(
+        BlogView,
+        ("id", "created_at", "post_id", "fingerprint", "ip_address", "country", "city", "region", "device",
+         "user_agent", "referrer", "utm_source", "utm_medium", "utm_campaign", "read_duration", "scroll_depth"),
+        ("post_id", "country", "device", "utm_source"),
+        _filter_by_columns,
+    ),
+}
+
+
+def export_filename(entity, fmt, compress=False):
+    return f"{entity}-{date.today().isoformat()}.{fmt}{'.gz' if compress else ''}"
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES) and not PHONE_NUMBER.fullmatch(value):
+        return "'" + value
+    return value
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def _encode_csv(columns, batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows([_cell(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header-only exports still produce a valid file.
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _encode_ndjson(columns, batches):
+    for rows in batches:
+        yield "".join(
+            json.dumps({name: _json_value(value) for name, value in zip(columns, row)}, ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+
+def export_query(entity, since=None, until=None, filters=None):
+    """
+    Column-only ``select`` for ``entity``, oldest id first.
+
+    ``filters`` holds equality/search values keyed by ``ExportSpec.filters``;
+    unknown keys and blank values are ignored. Raises ``ValueError`` for a
+    value that does not fit its column.
+    """
+    spec = EXPORTS[entity]
+    filters = {name: value for name, value in (filters or {}).items() if name in spec.filters and value}
+    query = select(*(getattr(spec.model, name) for name in spec.columns))
+    return spec.apply(spec, query, since, until, filters).order_by(spec.model.id)
+
+
+def iter_export(entity, fmt="csv", compress=False, since=None, until=None, filters=None,
+                batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Iterator of ``entity`` rows encoded as CSV or NDJSON bytes.
+
+    Rows are read with ``yield_per`` (a server-side cursor where the driver
+    supports one) and encoded one batch at a time, optionally through an
+    incremental gzip stream, so memory stays flat however many rows match.
+    The query is built up front, so bad filters raise before streaming.
+    CSV cells that would read as spreadsheet formulas are prefixed with ``'``.
+    """
+    query = export_query(entity, since, until, filters)
+    return _stream(query, EXPORTS[entity].columns, fmt, compress, batch_size)
+
+
+def _stream(query, columns, fmt, compress, batch_size):
+    result = db.session.execute(query, execution_options={"yield_per": batch_size})
+    encode = _encode_csv if fmt == "csv" else _encode_ndjson
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    try:
+        for text in encode(columns, result.partitions()):
+            data = text.encode("utf-8")
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                yield data
+        if compressor is not None:
+            yield compressor.flush()
+    finally:
+        result.close()
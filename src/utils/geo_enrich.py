@@ -0,0 +1,66 @@
+import logging
+
+from sqlalchemy import select, update
+
+from src.models.database import db, BlogView, VisitorLog
+from src.utils.geoip import geo_resolver
+
+logger = logging.getLogger(__name__)
+
+# Rows are written with the raw IP only; a NULL country marks them as pending.
+ENRICHABLE_MODELS = {
+    "visitor_log": VisitorLog,
+    "blog_views": BlogView,
+}
+
+UNRESOLVED_COUNTRY = "Unknown"
+
+
+def _first_hop(ip_address):
+    # X-Forwarded-For may carry a proxy chain; the client is the first entry.
+    return (ip_address or "").split(",")[0].strip()
+
+
+def enrich_geo(model, batch_size=1000, replay=False):
+    """
+    Fill ``country``/``city`` (and ``region`` where present) for ``model`` rows.
+
+    Walks the table in primary-key order with keyset pagination, resolves each
+    distinct IP once per batch and applies one bulk UPDATE per batch. Every
+    visited row gets a country (``UNRESOLVED_COUNTRY`` at worst), so pending
+    rows are read from the partial ``country IS NULL`` index and a run only
+    touches rows written since the last one. With ``replay=True`` every row is re-resolved, e.g. after a GeoIP database update.
+    Returns the number of rows updated.
+    """
+    has_region = hasattr(model, "region")
+    last_id = 0
+    updated = 0
+
+    while True:
+        query = select(model.id, model.ip_address).where(model.id > last_id)
+        if not replay:
+            query = query.where(model.country.is_(None))
+        rows = db.session.execute(query.order_by(model.id).limit(batch_size)).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        resolved = {ip: geo_resolver.lookup(_first_hop(ip)) for ip in {row.ip_address for row in rows}}
+        changes = []
+        for row in rows:
+            geo = resolved[row.ip_address]
+            change = {
+                "id": row.id,
+                "country": geo.get("country") or UNRESOLVED_COUNTRY,
+                "city": geo.get("city"),
+            }
+            if has_region:
+                change["region"] = geo.get("region")
+            changes.append(change)
+
+        db.session.execute(update(model), changes)
+        db.session.commit()
+        updated += len(changes)
+        logger.info("Geo-enriched %s %s rows (through id %s)", len(changes), model.__tablename__, last_id)
+
+    return updated
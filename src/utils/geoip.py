@@ -0,0 +1,132 @@
+import csv
+import gzip
+import ipaddress
+import logging
+from array import array
+from bisect import bisect_right
+
+from src.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class IPRangeDatabase:
+    """
+    Offline IP-range database held in compact sorted arrays.
+
+    Reads a CSV (optionally gzipped) of ``start_ip,end_ip,country,region,city``
+    rows, or the DB-IP "IP to City Lite" layout
+    (``start,end,continent,country,region,city,lat,lon``). Ranges must not
+    overlap; lookups are a single ``bisect`` over the range starts.
+    """
+
+    def __init__(self):
+        self._starts = {4: array("I"), 6: []}
+        self._ends = {4: array("I"), 6: []}
+        self._location_ids = {4: array("I"), 6: array("I")}
+        self._locations = []
+
+    @classmethod
+    def load(cls, path):
+        database = cls()
+        opener = gzip.open if path.endswith(".gz") else open
+        rows = {4: [], 6: []}
+        location_index = {}
+        with opener(path, "rt", encoding="utf-8", newline="") as handle:
+            for record in csv.reader(handle):
+                if len(record) < 5 or record[0].startswith("#"):
+                    continue
+                try:
+                    start = ipaddress.ip_address(record[0].strip())
+                    end = ipaddress.ip_address(record[1].strip())
+                except ValueError:
+                    continue  # header row or malformed line
+                if len(record) >= 8:
+                    location = (record[3], record[4], record[5])
+                else:
+                    location = (record[2], record[3], record[4])
+                location = tuple(value.strip() or None for value in location)
+                location_id = location_index.setdefault(location, len(location_index))
+                rows[start.version].append((int(start), int(end), location_id))
+
+        database._locations = [None] * len(location_index)
+        for location, location_id in location_index.items():
+            database._locations[location_id] = location
+        for version, version_rows in rows.items():
+            version_rows.sort()
+            for start, end, location_id in version_rows:
+                database._starts[version].append(start)
+                database._ends[version].append(end)
+                database._location_ids[version].append(location_id)
+        logger.info(
+            "Loaded %s IPv4 and %s IPv6 geo ranges from %s",
+            len(rows[4]), len(rows[6]), path,
+        )
+        return database
+
+    def lookup(self, address):
+        starts = self._starts[address.version]
+        position = bisect_right(starts, int(address)) - 1
+        if position < 0 or int(address) > self._ends[address.version][position]:
+            return {}
+        country, region, city = self._locations[self._location_ids[address.version][position]]
+        return {"country": country, "city": city, "region": region}
+
+
+class GeoResolver:
+    """
+    Shared, network-free geo lookup used by visitor logging and blog analytics.
+
+    The backend is any object with ``lookup(ipaddress) -> dict``; by default an
+    ``IPRangeDatabase`` loaded from ``GEOIP_DATABASE_PATH``. Results are cached
+    per IPv4 address / IPv6 /64 prefix. Without a backend every lookup is ``{}``.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.cache = TTLCache()
+
+    def init_app(self, app):
+        self.cache = TTLCache(
+            maxsize=int(app.config.get("GEOIP_CACHE_SIZE", self.cache.maxsize)),
+            ttl=float(app.config.get("GEOIP_CACHE_TTL", self.cache.ttl)),
+        )
+        path = app.config.get("GEOIP_DATABASE_PATH")
+        if self.backend is None and path:
+            try:
+                self.backend = IPRangeDatabase.load(path)
+            except OSError:
+                logger.warning("GeoIP database %s could not be read; geo lookup disabled", path)
+
+    def set_backend(self, backend):
+        self.backend = backend
+        self.cache.clear()
+
+    def lookup(self, ip_address):
+        if not ip_address or self.backend is None:
+            return {}
+        try:
+            address = ipaddress.ip_address(ip_address.strip())
+        except ValueError:
+            return {}
+        if not address.is_global:
+            return {}
+
+        if address.version == 6:
+            key = int(address) >> 64
+        else:
+            key = int(address)
+        cached = self.cache.get((address.version, key))
+        if cached is not None:
+            return cached
+
+        try:
+            result = self.backend.lookup(address)
+        except Exception:
+            logger.exception("GeoIP lookup failed for %s", ip_address)
+            result = {}
+        self.cache.set((address.version, key), result)
+        return result
+
+
+geo_resolver = GeoResolver()
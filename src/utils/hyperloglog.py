@@ -0,0 +1,71 @@
+import hashlib
+import math
+import zlib
+
+SKETCH_FORMAT_VERSION = 1
+
+
+class HyperLogLog:
+    """
+    HyperLogLog cardinality sketch with ``2 ** precision`` one-byte registers.
+
+    Values are hashed with a 64-bit BLAKE2b digest so sketches built in
+    different processes agree and can be merged. The default precision of 12
+    gives ~1.6% standard error; serialized sketches are zlib-compressed, so
+    quiet days cost far less than the 4 KB of raw registers.
+    """
+
+    def __init__(self, precision=12, registers=None):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.size)
+        if len(self.registers) != self.size:
+            raise ValueError("register count does not match precision")
+
+    def add(self, value):
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        remainder = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def estimate(self):
+        size = self.size
+        if size == 16:
+            alpha = 0.673
+        elif size == 32:
+            alpha = 0.697
+        elif size == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / size)
+
+        raw = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            return int(round(size * math.log(size / zeros)))
+        return int(round(raw))
+
+    def __len__(self):
+        return self.estimate()
+
+    def to_bytes(self):
+        return bytes([SKETCH_FORMAT_VERSION, self.precision]) + zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data):
+        if not data or data[0] != SKETCH_FORMAT_VERSION:
+            raise ValueError("unsupported sketch format")
+        return cls(precision=data[1], registers=zlib.decompress(data[2:]))
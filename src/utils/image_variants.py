@@ -0,0 +1,208 @@
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import current_app
+from markupsafe import Markup
+from werkzeug.security import safe_join
+
+from src.utils.cache import TTLCache
+from src.utils.static_assets import static_url
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # optional: originals are served as-is without Pillow
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".variants.json"
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+# Smallest first: browsers read srcset left to right.
+DEFAULT_WIDTHS = (480, 960, 1600)
+DEFAULT_FORMATS = ("avif", "webp")
+# GIFs are left alone: variants would drop their animation.
+VARIANT_EXTENSIONS = {"png", "jpg", "jpeg", "webp"}
+BODY_IMAGE_SIZES = "(min-width: 768px) 768px, 100vw"
+BODY_IMAGE_TAG = re.compile(r"<img\b(?P<attrs>[^>]*?)\bsrc=\"(?P<src>[^\"]+)\"(?P<rest>[^>]*)>", re.IGNORECASE)
+
+ImageSources = namedtuple("ImageSources", ["sources", "width", "height"])
+
+
+def _csv(value):
+    return [item.strip() for item in str(value or "").split(",") if item.strip()]
+
+
+def sidecar_path(path):
+    return path + SIDECAR_SUFFIX
+
+
+def build_variants(path, widths=DEFAULT_WIDTHS, formats=DEFAULT_FORMATS, quality=80):
+    """
+    Write resized, metadata-free variants of ``path`` and a JSON sidecar.
+
+    Runs in a worker process. Variants are never upscaled; the sidecar is
+    written last (atomically) so readers only ever see complete sets.
+    """
+    stem = os.path.splitext(path)[0]
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "P") else "RGB")
+        width, height = image.size
+
+        variants = []
+        for target in sorted({min(w, width) for w in widths}):
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.Resampling.LANCZOS
+            )
+            for fmt in formats:
+                # Pillow's wheels bundle libavif from 11.3; older or source builds may lack it.
+                if fmt == "avif" and not features.check("avif"):
+                    continue
+                variant_path = f"{stem}-{target}w.{fmt}"
+                # No exif/icc arguments are passed, so metadata is dropped.
+                resized.save(variant_path, format=fmt.upper(), quality=quality)
+                variants.append({
+                    "file": os.path.basename(variant_path),
+                    "format": fmt,
+                    "width": resized.width,
+                    "height": resized.height,
+                })
+
+    temporary = sidecar_path(path) + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump({"width": width, "height": height, "variants": variants}, handle)
+    os.replace(temporary, sidecar_path(path))
+    return len(variants)
+
+
+class ImageVariantPool:
+    """
+    Process pool that builds variants off the request path.
+
+    The pool is created on first use in each worker process and uses the
+    ``spawn`` start method, so children never inherit the app's threads
+    (analytics flushers) or open database connections.
+    """
+
+    def __init__(self, max_workers=2, widths=DEFAULT_WIDTHS, formats=DEFAULT_FORMATS, quality=80):
+        self.max_workers = max_workers
+        self.widths = widths
+        self.formats = formats
+        self.quality = quality
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._sidecars = TTLCache(maxsize=2000, ttl=60 * 60)
+
+    def init_app(self, app):
+        self.max_workers = int(app.config.get("IMAGE_VARIANT_WORKERS", self.max_workers))
+        self.widths = tuple(int(width) for width in _csv(app.config.get("IMAGE_VARIANT_WIDTHS"))) or self.widths
+        self.formats = tuple(fmt.lower() for fmt in _csv(app.config.get("IMAGE_VARIANT_FORMATS"))) or self.formats
+        self.quality = int(app.config.get("IMAGE_VARIANT_QUALITY", self.quality))
+        app.add_template_global(self.sources, "image_sources")
+        app.add_template_filter(responsive_images)
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def submit(self, path):
+        """Queue variant generation for a saved upload; a no-op without Pillow."""
+        if Image is None or os.path.splitext(path)[1].lower().lstrip(".") not in VARIANT_EXTENSIONS:
+            return None
+        future = self._pool().submit(build_variants, path, self.widths, self.formats, self.quality)
+        future.add_done_callback(lambda done: self._log_result(path, done))
+        return future
+
+    @staticmethod
+    def _log_result(path, future):
+        error = future.exception()
+        if error is not None:
+            logger.warning("Image variants failed for %s: %s", path, error)
+        else:
+            logger.info("Built %s image variants for %s", future.result(), path)
+
+    def process_missing(self, folder):
+        """Build variants for uploads under ``folder`` that have no sidecar yet; returns the count."""
+        if Image is None:
+            raise RuntimeError("Pillow is not installed")
+        pending = []
+        for root, _, files in os.walk(folder):
+            for name in files:
+                path = os.path.join(root, name)
+                if re.search(r"-\d+w\.\w+$", name) or os.path.exists(sidecar_path(path)):
+                    continue
+                future = self.submit(path)
+                if future is not None:
+                    pending.append(future)
+        for future in pending:
+            future.exception()
+        return len(pending)
+
+    def sources(self, url):
+        """
+        ``ImageSources`` for a stored ``/static/...`` image URL, or ``None``.
+
+        ``None`` (no sidecar yet, external URL, or Pillow missing at upload)
+        means templates fall back to the original image.
+        """
+        if not url:
+            return None
+        static_prefix = current_app.static_url_path.rstrip("/") + "/"
+        if not url.startswith(static_prefix):
+            return None
+        relative = url[len(static_prefix):]
+        cached = self._sidecars.get(relative)
+        if cached is not None:
+            return cached
+
+        path = safe_join(current_app.static_folder, relative)
+        try:
+            with open(sidecar_path(path), encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (TypeError, OSError, ValueError):
+            return None
+
+        directory = os.path.dirname(relative)
+        by_format = {}
+        for variant in data["variants"]:
+            src = static_url(f"{directory}/{variant['file']}")
+            by_format.setdefault(variant["format"], []).append(f"{src} {variant['width']}w")
+        sources = [
+            {"type": MIME_TYPES[fmt], "srcset": ", ".join(by_format[fmt])}
+            for fmt in DEFAULT_FORMATS
+            if fmt in by_format
+        ]
+        result = ImageSources(sources, data["width"], data["height"])
+        self._sidecars.set(relative, result)
+        return result
+
+
+image_variants = ImageVariantPool()
+
+
+def responsive_images(html, sizes=BODY_IMAGE_SIZES):
+    """Jinja filter: add a WebP ``srcset`` to uploaded ``<img>`` tags inside post HTML."""
+
+    def rewrite(match):
+        if "srcset=" in match.group(0).lower():
+            return match.group(0)
+        sources = image_variants.sources(match["src"])
+        webp = next((s["srcset"] for s in sources.sources if s["type"] == "image/webp"), None) if sources else None
+        if not webp:
+            return match.group(0)
+        return f'<img{match["attrs"]}src="{match["src"]}" srcset="{webp}" sizes="{sizes}"{match["rest"]}>'
+
+    return Markup(BODY_IMAGE_TAG.sub(rewrite, str(html or "")))
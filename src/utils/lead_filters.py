@@ -0,0 +1,76 @@
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import or_, select
+
+from src.models.database import db, Lead
+
+LEAD_STATUSES = ("new", "in-progress", "converted", "lost")
+LEAD_SOURCES = ("voice", "text", "form")
+
+LeadFilters = namedtuple("LeadFilters", ["status", "source", "intent", "since", "until", "q"])
+
+
+def _date_arg(value):
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def lead_filters_from_args(args):
+    """``LeadFilters`` from request args; blank or malformed values mean "no filter"."""
+
+    def text(name):
+        return " ".join((args.get(name) or "").split()) or None
+
+    return LeadFilters(
+        status=text("status"),
+        source=text("source"),
+        intent=text("intent"),
+        since=_date_arg(args.get("since")),
+        until=_date_arg(args.get("until")),
+        q=text("q"),
+    )
+
+
+def lead_filter_args(filters):
+    """Query-string arguments that reproduce ``filters``, for pager and export links."""
+    values = filters._asdict()
+    for name in ("since", "until"):
+        if values[name] is not None:
+            values[name] = values[name].isoformat()
+    return {name: value for name, value in values.items() if value is not None}
+
+
+def filter_leads(query, filters):
+    """
+    Narrow a ``select(Lead)`` by ``filters``.
+
+    Equality filters and the date range line up with the ``(column,
+    created_at, id)`` indexes on ``leads``; search is a prefix match so the
+    name/email/phone indexes (``varchar_pattern_ops`` on Postgres) can serve it.
+    """
+    if filters.status:
+        query = query.where(Lead.status == filters.status)
+    if filters.source:
+        query = query.where(Lead.source == filters.source)
+    if filters.intent:
+        query = query.where(Lead.intent == filters.intent)
+    if filters.since:
+        query = query.where(Lead.created_at >= datetime.combine(filters.since, datetime.min.time()))
+    if filters.until:
+        query = query.where(Lead.created_at < datetime.combine(filters.until + timedelta(days=1), datetime.min.time()))
+    if filters.q:
+        query = query.where(or_(
+            Lead.name.startswith(filters.q, autoescape=True),
+            Lead.email.startswith(filters.q, autoescape=True),
+            Lead.phone.startswith(filters.q, autoescape=True),
+        ))
+    return query
+
+
+def lead_intents(limit=100):
+    """Distinct intents for the filter dropdown, read off ``ix_leads_intent_created``."""
+    query = select(Lead.intent).where(Lead.intent.is_not(None)).distinct().order_by(Lead.intent).limit(limit)
+    return list(db.session.scalars(query))
@@ -0,0 +1,70 @@
+import base64
+from collections import namedtuple
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from src.models.database import db
+
+Page = namedtuple("Page", ["items", "next_cursor", "prev_cursor"])
+
+
+def encode_cursor(created_at, row_id):
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Return ``(created_at, id)`` for a cursor token, or ``None`` if it is malformed."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def keyset_page(query, created_column, id_column, page_size, after=None, before=None):
+    """
+    Fetch one page of ``query`` ordered newest first by ``(created_at, id)``.
+
+    ``after`` continues past the last row of the previous page and ``before``
+    walks back from the first row of the current one. Each page is a single
+    indexed range scan of ``page_size + 1`` rows, however deep the reader goes.
+    """
+    after = decode_cursor(after)
+    before = decode_cursor(before) if after is None else None
+
+    if before is not None:
+        created_at, row_id = before
+        query = query.where(
+            or_(created_column > created_at, and_(created_column == created_at, id_column > row_id))
+        ).order_by(created_column.asc(), id_column.asc())
+    else:
+        if after is not None:
+            created_at, row_id = after
+            query = query.where(
+                or_(created_column < created_at, and_(created_column == created_at, id_column < row_id))
+            )
+        query = query.order_by(created_column.desc(), id_column.desc())
+
+    rows = db.session.scalars(query.limit(page_size + 1)).unique().all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if before is not None:
+        rows.reverse()
+        has_newer, has_older = has_more, True
+    else:
+        has_newer, has_older = after is not None, has_more
+
+    def cursor(row):
+        return encode_cursor(getattr(row, created_column.key), getattr(row, id_column.key))
+
+    return Page(
+        items=rows,
+        next_cursor=cursor(rows[-1]) if rows and has_older else None,
+        prev_cursor=cursor(rows[0]) if rows and has_newer else None,
+    )
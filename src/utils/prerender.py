@@ -0,0 +1,96 @@
+import gzip
+import hashlib
+from collections import namedtuple
+from functools import wraps
+
+from flask import make_response, request
+from werkzeug.http import is_resource_modified
+
+from src.utils.cache import TTLCache
+from src.utils.conditional import cacheable_request, last_modified_for, template_version
+
+try:
+    import brotli
+except ImportError:  # optional: pages are served as gzip/identity without it
+    brotli = None
+
+PageVariant = namedtuple("PageVariant", ["body", "etag"])
+PrerenderedPage = namedtuple("PrerenderedPage", ["variants", "last_modified"])
+
+
+def _encode(html):
+    body = html.encode("utf-8")
+    etag = hashlib.sha1(body).hexdigest()
+    variants = {
+        "identity": PageVariant(body, etag),
+        "gzip": PageVariant(gzip.compress(body, compresslevel=9, mtime=0), f"{etag}-gz"),
+    }
+    if brotli is not None:
+        variants["br"] = PageVariant(brotli.compress(body, quality=11), f"{etag}-br")
+    return variants
+
+
+class PrerenderedPageCache:
+    """
+    Fully rendered constant pages, kept per host as identity/gzip/brotli bytes.
+
+    Pages are rendered and compressed once per (endpoint, host, template
+    version) on first hit; afterwards a request costs a dict lookup and an
+    ``Accept-Encoding`` match. Entries are bounded because ``Host`` is
+    client-controlled.
+    """
+
+    def __init__(self, maxsize=256, max_age=300):
+        self.max_age = max_age
+        self._pages = TTLCache(maxsize=maxsize, ttl=24 * 60 * 60)
+
+    def init_app(self, app):
+        self.max_age = int(app.config.get("PRERENDER_MAX_AGE", self.max_age))
+        self._pages = TTLCache(
+            maxsize=int(app.config.get("PRERENDER_CACHE_SIZE", self._pages.maxsize)),
+            ttl=self._pages.ttl,
+        )
+
+    def clear(self):
+        self._pages.clear()
+
+    def page(self, render):
+        key = (request.endpoint, request.host_url, template_version())
+        page = self._pages.get(key)
+        if page is None:
+            page = PrerenderedPage(_encode(render()), last_modified_for())
+            self._pages.set(key, page)
+        return page
+
+    def respond(self, page):
+        offered = [encoding for encoding in ("br", "gzip") if encoding in page.variants]
+        encoding = request.accept_encodings.best_match(offered) or "identity"
+        variant = page.variants[encoding]
+        if is_resource_modified(request.environ, etag=variant.etag, last_modified=page.last_modified):
+            response = make_response(variant.body)
+            response.content_type = "text/html; charset=utf-8"
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+        else:
+            response = make_response("", 304)
+        response.set_etag(variant.etag)
+        response.last_modified = page.last_modified
+        response.vary.add("Accept-Encoding")
+        response.cache_control.public = True
+        response.cache_control.max_age = self.max_age
+        return response
+
+
+prerendered_pages = PrerenderedPageCache()
+
+
+def prerendered(view):
+    """Serve a constant page from ``prerendered_pages``; the view only runs on a miss."""
+
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not cacheable_request():
+            return view(*args, **kwargs)
+        return prerendered_pages.respond(prerendered_pages.page(lambda: view(*args, **kwargs)))
+
+    return wrapped
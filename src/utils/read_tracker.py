@@ -0,0 +1,100 @@
+import logging
+import threading
+from datetime import datetime
+
+from sqlalchemy import bindparam, case, func, select, update
+
+from src.models.database import db, BlogView, Post
+from src.utils.write_behind import BackgroundFlusher
+
+logger = logging.getLogger(__name__)
+
+
+class ReadHeartbeatBuffer(BackgroundFlusher):
+    """
+    Coalesces blog read heartbeats per ``view_id`` and flushes them in bulk.
+
+    Only the latest ``read_duration`` and the deepest ``scroll_depth`` seen for
+    a view are kept, so a reader sending dozens of beacons costs one row in a
+    single executemany UPDATE per interval. At most ``max_pending`` views are
+    buffered; heartbeats for new views are dropped until the next flush.
+    """
+
+    def __init__(self, name="read-heartbeats", interval=5.0, max_pending=20000):
+        super().__init__(name, interval=interval)
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.interval = float(app.config.get("READ_TRACKING_FLUSH_INTERVAL", self.interval))
+        self.max_pending = int(app.config.get("READ_TRACKING_MAX_PENDING", self.max_pending))
+        super().init_app(app)
+
+    def _reset_after_fork(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def record(self, slug, view_id, read_duration=None, scroll_depth=None):
+        self.ensure_started()
+        with self._lock:
+            entry = self._pending.get(view_id)
+            if entry is None and len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                dropped = self.dropped
+            else:
+                dropped = None
+                if entry is None:
+                    entry = self._pending[view_id] = {
+                        "b_view_id": view_id,
+                        "b_slug": slug,
+                        "b_read_duration": None,
+                        "b_scroll_depth": None,
+                    }
+                if read_duration is not None:
+                    entry["b_read_duration"] = read_duration
+                if scroll_depth is not None:
+                    entry["b_scroll_depth"] = max(scroll_depth, entry["b_scroll_depth"] or 0)
+                entry["b_updated_at"] = datetime.utcnow()
+            overflowing = len(self._pending) >= self.max_pending
+        if dropped is not None and dropped % 1000 == 1:
+            logger.warning("%s buffer full, dropped %s heartbeats so far", self.name, dropped)
+        if overflowing:
+            self.wake()
+
+    def _drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        new_depth = bindparam("b_scroll_depth", type_=db.Integer)
+        statement = (
+            update(BlogView.__table__)
+            .where(BlogView.id == bindparam("b_view_id"))
+            .where(
+                BlogView.post_id
+                == select(Post.id).where(Post.slug == bindparam("b_slug")).scalar_subquery()
+            )
+            .values(
+                read_duration=func.coalesce(bindparam("b_read_duration", type_=db.Integer), BlogView.read_duration),
+                scroll_depth=case(
+                    (BlogView.scroll_depth.is_(None), new_depth),
+                    (BlogView.scroll_depth < new_depth, new_depth),
+                    else_=BlogView.scroll_depth,
+                ),
+                updated_at=bindparam("b_updated_at"),
+            )
+        )
+        try:
+            db.session.execute(statement, list(pending.values()))
+            db.session.commit()
+        except Exception:
+            with self._lock:
+                for view_id, entry in pending.items():
+                    self._pending.setdefault(view_id, entry)
+            raise
+
+
+read_heartbeats = ReadHeartbeatBuffer()
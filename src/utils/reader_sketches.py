@@ -0,0 +1,130 @@
+import threading
+from collections import defaultdict
+from datetime import date, datetime
+
+from sqlalchemy import func, select
+
+from src.models.database import db, BlogView, PostReaderSketch
+from src.utils.hyperloglog import HyperLogLog
+from src.utils.write_behind import BackgroundFlusher
+
+
+class ReaderSketchBuffer(BackgroundFlusher):
+    """
+    Per-process HyperLogLog sketches of reader fingerprints per (post, day).
+
+    Views are added in memory; each interval the sketches are merged into
+    ``post_reader_sketches`` rows (register-wise max, so merging is idempotent).
+    """
+
+    def __init__(self, name="reader-sketches", interval=30.0, precision=12):
+        super().__init__(name, interval=interval)
+        self.precision = precision
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.interval = float(app.config.get("READER_SKETCH_FLUSH_INTERVAL", self.interval))
+        super().init_app(app)
+
+    def _reset_after_fork(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def add(self, post_id, fingerprint, day=None):
+        if not fingerprint:
+            return
+        self.ensure_started()
+        key = (post_id, day or datetime.utcnow().date())
+        with self._lock:
+            sketch = self._pending.get(key)
+            if sketch is None:
+                sketch = self._pending[key] = HyperLogLog(self.precision)
+            sketch.add(fingerprint)
+
+    def _drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            merge_sketches(pending)
+        except Exception:
+            with self._lock:
+                for key, sketch in pending.items():
+                    current = self._pending.get(key)
+                    self._pending[key] = current.merge(sketch) if current else sketch
+            raise
+
+
+def merge_sketches(sketches):
+    """Merge ``{(post_id, day): HyperLogLog}`` into the stored sketches and commit."""
+    post_ids = {post_id for post_id, _ in sketches}
+    days = {day for _, day in sketches}
+    stored = {
+        (row.post_id, row.day): row
+        for row in db.session.execute(
+            select(PostReaderSketch)
+            .where(PostReaderSketch.post_id.in_(post_ids), PostReaderSketch.day.in_(days))
+            .with_for_update()
+        ).scalars()
+    }
+    for (post_id, day), sketch in sketches.items():
+        row = stored.get((post_id, day))
+        if row is None:
+            db.session.add(PostReaderSketch(post_id=post_id, day=day, sketch=sketch.to_bytes()))
+        else:
+            row.sketch = HyperLogLog.from_bytes(row.sketch).merge(sketch).to_bytes()
+    db.session.commit()
+
+
+def unique_readers(post_ids=None, since=None, until=None):
+    """Estimated distinct readers per post over ``[since, until]`` (inclusive days)."""
+    query = select(PostReaderSketch.post_id, PostReaderSketch.sketch)
+    if post_ids is not None:
+        query = query.where(PostReaderSketch.post_id.in_(post_ids))
+    if since is not None:
+        query = query.where(PostReaderSketch.day >= since)
+    if until is not None:
+        query = query.where(PostReaderSketch.day <= until)
+
+    merged = {}
+    for post_id, blob in db.session.execute(query):
+        sketch = HyperLogLog.from_bytes(blob)
+        if post_id in merged:
+            merged[post_id].merge(sketch)
+        else:
+            merged[post_id] = sketch
+    return {post_id: sketch.estimate() for post_id, sketch in merged.items()}
+
+
+def rebuild_reader_sketches(batch_size=10000, precision=12):
+    """
+    Fold the full ``blog_views`` history into the stored sketches.
+
+    Views are read one post at a time and merged before moving on, so memory
+    stays bounded by a single post's daily sketches.
+    """
+    post_ids = db.session.scalars(
+        select(BlogView.post_id).where(BlogView.fingerprint.is_not(None)).distinct().order_by(BlogView.post_id)
+    ).all()
+    processed = 0
+    for post_id in post_ids:
+        sketches = defaultdict(lambda: HyperLogLog(precision))
+        rows = db.session.execute(
+            select(func.date(BlogView.created_at), BlogView.fingerprint)
+            .where(BlogView.post_id == post_id, BlogView.fingerprint.is_not(None)),
+            execution_options={"yield_per": batch_size},
+        )
+        for day, fingerprint in rows:
+            # func.date() yields a date on Postgres/MySQL and an ISO string on SQLite.
+            if isinstance(day, str):
+                day = date.fromisoformat(day)
+            sketches[(post_id, day)].add(fingerprint)
+            processed += 1
+        if sketches:
+            merge_sketches(dict(sketches))
+    return processed
+
+
+reader_sketches = ReaderSketchBuffer()
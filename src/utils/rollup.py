@@ -0,0 +1,166 @@
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import and_, delete, func, insert, or_, select
+
+from src.models.database import db, RollupWatermark, VisitorDailyRollup, VisitorLog
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_DIMENSIONS = ("path", "utm_source", "utm_medium", "utm_campaign", "country")
+# Comfortably longer than an analytics write-behind flush, so in-flight rows have committed.
+DEFAULT_ROLLUP_LAG = timedelta(minutes=5)
+
+
+def _as_date(value):
+    # func.date() yields a date on Postgres/MySQL and an ISO string on SQLite.
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _rollup_horizon(after_id, cutoff, enriched_only):
+    """
+    Highest id the rollup may fold: the end of the run of rows after ``after_id``
+    created before ``cutoff`` (and geo-enriched, with ``enriched_only``).
+
+    Write-behind batches from several workers commit out of id order, so a
+    recent row may still be followed by lower ids that are not visible yet;
+    stopping at the first recent row keeps the watermark from skipping them.
+    """
+    unsettled = VisitorLog.created_at >= cutoff
+    if enriched_only:
+        unsettled = or_(unsettled, VisitorLog.country.is_(None))
+    first_unsettled = db.session.scalar(
+        select(func.min(VisitorLog.id)).where(VisitorLog.id > after_id, unsettled)
+    )
+    query = select(func.max(VisitorLog.id)).where(VisitorLog.id > after_id)
+    if first_unsettled is not None:
+        query = query.where(VisitorLog.id < first_unsettled)
+    return db.session.scalar(query) or after_id
+
+
+def _day_range(days):
+    return or_(*(
+        and_(VisitorLog.created_at >= start, VisitorLog.created_at < start + timedelta(days=1))
+        for start in (datetime.combine(day, datetime.min.time()) for day in days)
+    ))
+
+
+def rollup_visitors(batch_size=50000, lag=DEFAULT_ROLLUP_LAG, enriched_only=False):
+    """
+    Rebuild the daily rollups of the days touched by ``visitor_log`` rows newer than the stored watermark.
+
+    Only rows older than ``lag`` advance the watermark, so write-behind
+    batches still in flight (and, with ``enriched_only``, rows ``geo-enrich``
+    has not reached) are picked up by a later run instead of being skipped.
+    Each batch of new ids only picks the days to rebuild; those days are then
+    re-aggregated from every row up to the batch's last id. A row replayed
+    from the write-behind spool with an old ``created_at``, or one that
+    committed below the watermark, is therefore counted the next time its day
+    is touched rather than folded in twice or missed. The rebuild and the
+    watermark move commit together, and a rebuild is idempotent, so a crashed
+    run is simply retried. Returns the number of new raw rows processed.
+    """
+    watermark = db.session.execute(
+        select(RollupWatermark).where(RollupWatermark.name == VisitorLog.__tablename__).with_for_update()
+    ).scalar_one_or_none()
+    if watermark is None:
+        watermark = RollupWatermark(name=VisitorLog.__tablename__, last_id=0)
+        db.session.add(watermark)
+
+    horizon = _rollup_horizon(watermark.last_id, datetime.utcnow() - lag, enriched_only)
+    processed = 0
+
+    while watermark.last_id < horizon:
+        lower = watermark.last_id
+        batch_ids = (
+            select(VisitorLog.id)
+            .where(VisitorLog.id > lower, VisitorLog.id <= horizon)
+            .order_by(VisitorLog.id)
+            .limit(batch_size)
+            .subquery()
+        )
+        upper = db.session.scalar(select(func.max(batch_ids.c.id)))
+        if upper is None:
+            break
+        day = func.date(VisitorLog.created_at)
+        new_rows = {
+            _as_date(row[0]): row[1]
+            for row in db.session.execute(
+                select(day, func.count())
+                .where(VisitorLog.id > lower, VisitorLog.id <= upper, VisitorLog.created_at.is_not(None))
+                .group_by(day)
+            )
+        }
+
+        if new_rows:
+            keys = (
+                func.coalesce(VisitorLog.path, ""),
+                func.coalesce(VisitorLog.utm_source, ""),
+                func.coalesce(VisitorLog.utm_medium, ""),
+                func.coalesce(VisitorLog.utm_campaign, ""),
+                func.coalesce(VisitorLog.country, "Unknown"),
+            )
+            grouped = db.session.execute(
+                select(day, *keys, func.count())
+                .where(_day_range(new_rows), VisitorLog.id <= upper)
+                .group_by(day, *keys)
+            ).all()
+            db.session.execute(delete(VisitorDailyRollup).where(VisitorDailyRollup.day.in_(list(new_rows))))
+            db.session.execute(
+                insert(VisitorDailyRollup),
+                [
+                    dict(zip(("day", *ROLLUP_DIMENSIONS), (_as_date(row[0]), *row[1:6])), hits=row[6])
+                    for row in grouped
+                ],
+            )
+
+        watermark.last_id = upper
+        db.session.commit()
+        processed += sum(new_rows.values())
+        logger.info("Rolled up visitor_log ids %s-%s, rebuilt %s days", lower + 1, upper, len(new_rows))
+
+        # Re-take the row lock released by the commit before the next batch.
+        watermark = db.session.execute(
+            select(RollupWatermark).where(RollupWatermark.name == VisitorLog.__tablename__).with_for_update()
+        ).scalar_one()
+
+    db.session.commit()
+    return processed
+
+
+def visitor_trends(days=30, limit=10):
+    """Chart data for the admin visitor page, read only from the rollup table."""
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
+    in_range = VisitorDailyRollup.day >= since
+
+    per_day = dict(
+        db.session.execute(
+            select(VisitorDailyRollup.day, func.sum(VisitorDailyRollup.hits))
+            .where(in_range)
+            .group_by(VisitorDailyRollup.day)
+        ).all()
+    )
+    daily = []
+    for offset in range(days):
+        current = since + timedelta(days=offset)
+        daily.append({"day": current, "hits": int(per_day.get(current, 0) or 0)})
+
+    def top(column):
+        total = func.sum(VisitorDailyRollup.hits)
+        return [
+            {"label": label or "(none)", "hits": int(hits)}
+            for label, hits in db.session.execute(
+                select(column, total).where(in_range).group_by(column).order_by(total.desc()).limit(limit)
+            ).all()
+        ]
+
+    return {
+        "days": days,
+        "daily": daily,
+        "total": sum(point["hits"] for point in daily),
+        "peak": max((point["hits"] for point in daily), default=0),
+        "top_paths": top(VisitorDailyRollup.path),
+        "top_sources": top(VisitorDailyRollup.utm_source),
+        "top_campaigns": top(VisitorDailyRollup.utm_campaign),
+        "top_countries": top(VisitorDailyRollup.country),
+    }
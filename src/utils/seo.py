@@ -1,6 +1,8 @@
-from flask import url_for, request
+from flask import request
 
-def meta_tags(title=None, description=None, image=None, keywords=None):
+from src.utils.static_assets import static_url
+
+def meta_tags(title=None, description=None, image=None, keywords=None, url=None):
     """
     Returns meta tag data for templates.
     Dynamically builds canonical URLs and sets defaults if not provided.
@@ -10,10 +12,11 @@ def meta_tags(title=None, description=None, image=None, keywords=None):
         "Vertikal Agent helps businesses automate sales, support, and operations "
         "with AI-powered voice and chat agents tailored for every industry."
     )
-    default_image = url_for('static', filename='images/logo.jpeg', _external=True)
+    default_image = static_url('images/logo.jpeg', _external=True)
     default_keywords = "AI Agent, Automation, Chatbot, WhatsApp Bot, Business Automation, Vertikal"
 
-    page_url = request.url
+    # Query strings (UTM tags etc.) are not part of the canonical URL.
+    page_url = url or request.base_url
 
     meta = {
         "title": title or default_title,
@@ -0,0 +1,183 @@
+import gzip
+import hashlib
+import io
+from collections import namedtuple
+from datetime import datetime
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from flask import url_for
+from sqlalchemy import func, select
+
+from src.models.database import db, Post
+from src.utils.cache import TTLCache
+from src.utils.conditional import published_posts_version
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+# Sitemap protocol limit per file; larger sites are served as an index.
+MAX_SITEMAP_URLS = 50000
+SLUG_PLACEHOLDER = "__VERTIKAL_SLUG__"
+
+STATIC_ROUTES = (
+    "home.homepage",
+    "home.about_page",
+    "home.solution_core_agent",
+    "home.solution_workflow_integration",
+    "home.solution_conversational_agent",
+    "home.solution_custom_agent",
+    "home.solution_voice_agent",
+    "home.contact_us",
+    "home.privacy_policy",
+    "home.terms_of_service",
+    "home.security_overview",
+    "home.blog_listing",
+)
+
+SitemapDocument = namedtuple("SitemapDocument", ["body", "gzip_body", "etag", "last_modified"])
+
+
+class _XmlWriter:
+    """Accumulates the XML once while gzipping it incrementally."""
+
+    def __init__(self):
+        self._raw = io.BytesIO()
+        self._compressed = io.BytesIO()
+        self._gzip = gzip.GzipFile(fileobj=self._compressed, mode="wb", mtime=0)
+
+    def write(self, text):
+        chunk = text.encode("utf-8")
+        self._raw.write(chunk)
+        self._gzip.write(chunk)
+
+    def entry(self, tag, loc, lastmod):
+        self.write(f"  <{tag}>\n    <loc>{escape(loc)}</loc>\n    <lastmod>{lastmod}</lastmod>\n  </{tag}>\n")
+
+    def finish(self, last_modified):
+        self._gzip.close()
+        body = self._raw.getvalue()
+        return SitemapDocument(
+            body=body,
+            gzip_body=self._compressed.getvalue(),
+            etag=hashlib.sha1(body).hexdigest(),
+            last_modified=last_modified,
+        )
+
+
+class SitemapBuilder:
+    """
+    Builds sitemap XML once per content version and keeps the bytes.
+
+    The version is one aggregate over published posts (count + newest
+    timestamp), so every worker notices publishes, edits and deletes without
+    cross-process invalidation. Beyond ``max_urls`` the root becomes a sitemap
+    index whose child files stream post rows from a server-side cursor.
+    """
+
+    def __init__(self, maxsize=16, ttl=24 * 60 * 60, max_urls=MAX_SITEMAP_URLS):
+        self.max_urls = max_urls
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def init_app(self, app):
+        self.max_urls = min(int(app.config.get("SITEMAP_MAX_URLS", self.max_urls)), MAX_SITEMAP_URLS)
+        self._cache = TTLCache(
+            maxsize=self._cache.maxsize,
+            ttl=float(app.config.get("SITEMAP_CACHE_TTL", self._cache.ttl)),
+        )
+
+    def clear(self):
+        self._cache.clear()
+
+    def document(self, host, part=None):
+        """Root sitemap (``part=None``) or one child file; ``None`` if ``part`` does not exist."""
+        count, newest = published_posts_version()
+        # Static pages advertise today's date, so the day is part of the version too.
+        today = datetime.utcnow().date()
+        version = (count, newest, today)
+        last_modified = newest or datetime.combine(today, datetime.min.time())
+
+        key = (host, part, version)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        sharded = len(STATIC_ROUTES) + count > self.max_urls
+        if part is None:
+            if sharded:
+                document = self._build_index(version, last_modified)
+            else:
+                document = self._build_urlset(None, today, last_modified)
+        else:
+            if not sharded:
+                return None
+            chunks = self._chunk_starts(version)
+            if not 0 <= part <= len(chunks):
+                return None
+            if part == 0:
+                document = self._build_urlset((), today, last_modified)
+            else:
+                start = chunks[part - 1]
+                end = chunks[part] if part < len(chunks) else None
+                document = self._build_urlset((start, end), today, last_modified, include_static=False)
+
+        self._cache.set(key, document)
+        return document
+
+    def _chunk_starts(self, version):
+        # First post id of every max_urls-sized chunk, found in one indexed pass.
+        key = ("chunks", version)
+        starts = self._cache.get(key)
+        if starts is None:
+            numbered = (
+                select(Post.id, func.row_number().over(order_by=Post.id).label("position"))
+                .where(Post.is_published.is_(True))
+                .subquery()
+            )
+            starts = db.session.scalars(
+                select(numbered.c.id)
+                .where((numbered.c.position - 1) % self.max_urls == 0)
+                .order_by(numbered.c.id)
+            ).all()
+            self._cache.set(key, starts)
+        return starts
+
+    def _build_index(self, version, last_modified):
+        writer = _XmlWriter()
+        writer.write(f"<?xml version='1.0' encoding='UTF-8'?>\n<sitemapindex xmlns='{SITEMAP_NS}'>\n")
+        lastmod = last_modified.date().isoformat()
+        for part in range(len(self._chunk_starts(version)) + 1):
+            writer.entry("sitemap", url_for("home.sitemap_part", part=part, _external=True), lastmod)
+        writer.write("</sitemapindex>")
+        return writer.finish(last_modified)
+
+    def _build_urlset(self, post_range, today, last_modified, include_static=True):
+        """``post_range`` is ``None`` for every post, ``()`` for none, or ``(start_id, end_id)``."""
+        writer = _XmlWriter()
+        writer.write(f"<?xml version='1.0' encoding='UTF-8'?>\n<urlset xmlns='{SITEMAP_NS}'>\n")
+
+        if include_static:
+            for endpoint in STATIC_ROUTES:
+                writer.entry("url", url_for(endpoint, _external=True), today.isoformat())
+
+        if post_range != ():
+            # url_for once, then splice slugs in: building 50k URLs stays cheap.
+            post_url = url_for("home.blog_detail_public", slug=SLUG_PLACEHOLDER, _external=True)
+            query = (
+                select(Post.slug, Post.updated_at, Post.created_at)
+                .where(Post.is_published.is_(True))
+                .order_by(Post.id)
+            )
+            if post_range:
+                start, end = post_range
+                query = query.where(Post.id >= start)
+                if end is not None:
+                    query = query.where(Post.id < end)
+            rows = db.session.execute(query, execution_options={"yield_per": 1000})
+            for slug, updated_at, created_at in rows:
+                lastmod = (updated_at or created_at or last_modified).date().isoformat()
+                writer.entry("url", post_url.replace(SLUG_PLACEHOLDER, quote(slug)), lastmod)
+
+        writer.write("</urlset>")
+        return writer.finish(last_modified)
+
+
+sitemap_builder = SitemapBuilder()
@@ -0,0 +1,58 @@
+import re
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+
+from src.models.database import db
+
+SLUG_ATTEMPTS = 5
+
+
+def allocate_slug(model, base_slug, exclude_id=None):
+    """
+    ``base_slug`` or the first free ``base_slug-N`` (N >= 2) for ``model``.
+
+    One prefix query fetches every taken variant, and the suffix is picked in
+    memory, so popular titles cost a single round trip.
+    """
+    query = select(model.slug).where(
+        or_(model.slug == base_slug, model.slug.startswith(f"{base_slug}-", autoescape=True))
+    )
+    if exclude_id is not None:
+        query = query.where(model.id != exclude_id)
+    # The caller's pending row must not be flushed before its slug is chosen.
+    with db.session.no_autoflush:
+        taken = set(db.session.scalars(query))
+    if base_slug not in taken:
+        return base_slug
+
+    pattern = re.compile(rf"{re.escape(base_slug)}-(\d+)")
+    suffixes = {int(match.group(1)) for match in map(pattern.fullmatch, taken) if match}
+    suffix = 2
+    while suffix in suffixes:
+        suffix += 1
+    return f"{base_slug}-{suffix}"
+
+
+def flush_with_unique_slug(instance, base_slug):
+    """
+    Assign a free slug to ``instance`` and flush it inside a savepoint.
+
+    A concurrent writer can claim the same slug between the lookup and the
+    INSERT/UPDATE; the unique constraint then fails only the savepoint and
+    the next free suffix is tried.
+    """
+    model = type(instance)
+    # Flush the caller's other changes now: SAVEPOINT autoflushes, and a slug
+    # already assigned on a persistent row would be written outside it.
+    db.session.flush()
+    for attempt in range(SLUG_ATTEMPTS):
+        try:
+            with db.session.begin_nested():
+                instance.slug = allocate_slug(model, base_slug, exclude_id=instance.id)
+                db.session.add(instance)
+                db.session.flush()
+            return instance.slug
+        except IntegrityError:
+            if attempt == SLUG_ATTEMPTS - 1:
+                raise
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import re
+import threading
+
+from flask import current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+from src.utils.compression import PRECOMPRESSED
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_LENGTH = 12
+FINGERPRINTED = re.compile(r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{%d})(?P<ext>\.[^./]+)$" % FINGERPRINT_LENGTH)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+SKIPPED_SUFFIXES = tuple(suffix for _, suffix in PRECOMPRESSED)
+
+
+def _digest(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(64 * 1024), b""):
+            hasher.update(block)
+    return hasher.hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def fingerprinted_name(filename, digest):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{digest}{ext}"
+
+
+class StaticManifest:
+    """
+    Content hashes of static files, used to emit ``file.<hash>.ext`` URLs.
+
+    ``flask fingerprint-static`` writes the manifest at build time; files
+    missing from it (new uploads, or no build step) are hashed on first use.
+    Entries are trusted for the life of the process except in debug, where
+    edited files are re-hashed when their mtime or size changes.
+    """
+
+    def __init__(self):
+        self.manifest_path = None
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.manifest_path = app.config.get("STATIC_MANIFEST_PATH") or os.path.join(
+            app.root_path, "static-manifest.json"
+        )
+        self._entries = self._load()
+        app.view_functions["static"] = serve_static
+        app.add_template_global(static_url)
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as handle:
+                return {name: tuple(entry) for name, entry in json.load(handle).items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable static manifest %s", self.manifest_path)
+            return {}
+
+    def digest(self, filename):
+        """Hash of ``filename`` (relative to the static folder), or ``None`` if it does not exist."""
+        entry = self._entries.get(filename)
+        if entry is not None and not current_app.debug:
+            return entry[2]
+        path = safe_join(current_app.static_folder, filename)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if stat is None:
+            return None
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+        entry = (stat.st_mtime_ns, stat.st_size, _digest(path))
+        with self._lock:
+            self._entries[filename] = entry
+        return entry[2]
+
+    def build(self, static_folder):
+        """Hash every static file and write the manifest; returns the number of files."""
+        entries = {}
+        for root, _, files in os.walk(static_folder):
+            for name in files:
+                if name.endswith(SKIPPED_SUFFIXES):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                relative = os.path.relpath(path, static_folder).replace(os.sep, "/")
+                entries[relative] = (stat.st_mtime_ns, stat.st_size, _digest(path))
+        with open(self.manifest_path, "w", encoding="utf-8") as handle:
+            json.dump(entries, handle, indent=0, sort_keys=True)
+        self._entries = entries
+        return len(entries)
+
+    def resolve(self, filename):
+        """Map a requested name to ``(real filename, is current fingerprint)``."""
+        match = FINGERPRINTED.match(filename)
+        if match:
+            original = f"{match['stem']}{match['ext']}"
+            current = self.digest(original)
+            if current is not None:
+                return original, current == match["digest"]
+        return filename, False
+
+
+static_manifest = StaticManifest()
+
+
+def static_url(filename, _external=False):
+    """
+    URL for a static asset with its content hash in the name.
+
+    Accepts ``images/logo.jpeg`` or a stored ``/static/...`` path (blog
+    uploads); anything else, such as an external URL, is returned unchanged.
+    """
+    if not filename:
+        return filename
+    static_prefix = current_app.static_url_path.rstrip("/") + "/"
+    if filename.startswith(static_prefix):
+        filename = filename[len(static_prefix):]
+    elif "://" in filename or filename.startswith("/"):
+        return filename
+    digest = static_manifest.digest(filename)
+    if digest is not None:
+        filename = fingerprinted_name(filename, digest)
+    return url_for("static", filename=filename, _external=_external)
+
+
+def serve_static(filename):
+    """
+    Static view: resolves fingerprinted names and prefers prebuilt siblings.
+
+    A name carrying the current hash is cached as immutable for a year, so
+    repeat visits make no revalidation requests. ``.br``/``.gz`` siblings from
+    ``flask compress-static`` are used while they are at least as new as the
+    original, so a stale build never shadows an updated asset.
+    """
+    filename, immutable = static_manifest.resolve(filename)
+    static_folder = current_app.static_folder
+    path = safe_join(static_folder, filename)
+    response = None
+    for encoding, suffix in PRECOMPRESSED:
+        if path is None or not request.accept_encodings[encoding]:
+            continue
+        try:
+            if os.path.getmtime(path + suffix) < os.path.getmtime(path):
+                continue
+        except OSError:
+            continue
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        response = send_from_directory(static_folder, filename + suffix, mimetype=mimetype)
+        response.headers["Content-Encoding"] = encoding
+        break
+    if response is None:
+        response = current_app.send_static_file(filename)
+    response.vary.add("Accept-Encoding")
+    if immutable and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+        response.cache_control.no_cache = None
+    return response
@@ -0,0 +1,59 @@
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from slugify import slugify
+
+from src.models.database import db, Tag
+
+INSERT_ATTEMPTS = 3
+
+
+def normalize_tag_names(raw_tags):
+    """
+    ``{slug: name}`` for a comma-separated tag string, in input order.
+
+    Whitespace is collapsed, blanks are dropped, and names that slugify to
+    an already-seen slug keep their first spelling.
+    """
+    names = {}
+    for candidate in (raw_tags or "").split(","):
+        cleaned_name = " ".join(candidate.split())
+        if not cleaned_name:
+            continue
+        tag_slug = slugify(cleaned_name)
+        if tag_slug and tag_slug not in names:
+            names[tag_slug] = cleaned_name
+    return names
+
+
+def _tags_by_slug(slugs):
+    return {tag.slug: tag for tag in db.session.scalars(select(Tag).where(Tag.slug.in_(slugs)))}
+
+
+def resolve_tags(raw_tags):
+    """
+    ``Tag`` rows for a comma-separated tag string, in input order.
+
+    Existing tags come from one ``IN`` query and missing ones are created
+    with a single multi-row INSERT, so a post's tags cost a constant number
+    of queries however many there are. The INSERT runs in a savepoint: if a
+    concurrent save created one of the tags first, only the savepoint fails
+    and the lookup is repeated.
+    """
+    names = normalize_tag_names(raw_tags)
+    if not names:
+        return []
+
+    slugs = list(names)
+    tags = _tags_by_slug(slugs)
+    for attempt in range(INSERT_ATTEMPTS):
+        missing = [{"slug": tag_slug, "name": names[tag_slug]} for tag_slug in slugs if tag_slug not in tags]
+        if not missing:
+            break
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(Tag), missing)
+        except IntegrityError:
+            if attempt == INSERT_ATTEMPTS - 1:
+                raise
+        tags = _tags_by_slug(slugs)
+    return [tags[tag_slug] for tag_slug in slugs]
@@ -0,0 +1,151 @@
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from src.models.database import db, Post, UploadBlob
+from src.utils.image_variants import SIDECAR_SUFFIX, image_variants
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+STATIC_URL_IN_HTML = re.compile(r"/static/([^\"'\s)>?#]+)")
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+def blob_url(path):
+    return f"/static/{path}"
+
+
+def store_upload(file_storage, folder, extension, max_bytes):
+    """
+    Stream an upload into the content-addressed store under ``folder``.
+
+    The body is hashed while it is copied to a temp file in the target
+    directory, then renamed to ``<folder>/<sha[:2]>/<sha>.<ext>``. Content
+    that is already stored is not written twice: the existing blob's URL is
+    returned instead and its ``last_used_at`` refreshed, which restarts its
+    garbage-collection grace period. Raises ``UploadTooLarge`` past ``max_bytes``.
+    """
+    os.makedirs(folder, exist_ok=True)
+    hasher = hashlib.sha256()
+    size = 0
+    handle = tempfile.NamedTemporaryFile(dir=folder, prefix=".upload-", delete=False)
+    try:
+        with handle:
+            for chunk in iter(lambda: file_storage.stream.read(CHUNK_SIZE), b""):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"upload exceeds {max_bytes} bytes")
+                hasher.update(chunk)
+                handle.write(chunk)
+
+        digest = hasher.hexdigest()
+        existing = db.session.execute(select(UploadBlob).where(UploadBlob.sha256 == digest)).scalar_one_or_none()
+        if existing is not None and os.path.exists(os.path.join(current_app.static_folder, existing.path)):
+            _touch(digest)
+            return blob_url(existing.path)
+
+        final_path = os.path.join(folder, digest[:2], f"{digest}{extension}")
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(handle.name, final_path)
+    finally:
+        if os.path.exists(handle.name):
+            os.remove(handle.name)
+
+    relative = os.path.relpath(final_path, current_app.static_folder).replace(os.sep, "/")
+    if existing is not None:
+        # The indexed file went missing; the upload just restored it.
+        existing.path = relative
+        existing.last_used_at = datetime.utcnow()
+    else:
+        db.session.add(UploadBlob(
+            sha256=digest,
+            path=relative,
+            size=size,
+            content_type=file_storage.mimetype,
+            original_name=file_storage.filename,
+        ))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # A concurrent upload of the same bytes indexed it first; same file either way.
+        db.session.rollback()
+        winner = db.session.execute(select(UploadBlob.path).where(UploadBlob.sha256 == digest)).scalar_one()
+        _touch(digest)
+        return blob_url(winner)
+
+    image_variants.submit(final_path)
+    return blob_url(relative)
+
+
+def _touch(digest):
+    db.session.execute(update(UploadBlob).where(UploadBlob.sha256 == digest).values(last_used_at=datetime.utcnow()))
+    db.session.commit()
+
+
+def referenced_static_paths():
+    """Static-relative paths referenced by any post's cover image or body HTML."""
+    referenced = set()
+    rows = db.session.execute(
+        select(Post.cover_image, Post.content), execution_options={"yield_per": 500}
+    )
+    for cover_image, content in rows:
+        for text in (cover_image, content):
+            if text:
+                referenced.update(match.group(1) for match in STATIC_URL_IN_HTML.finditer(text))
+    return referenced
+
+
+def collect_garbage(grace=timedelta(days=1), dry_run=False):
+    """
+    Delete blobs (and their image variants) that no post references.
+
+    Blobs uploaded (or re-uploaded) within ``grace`` are kept: an editor
+    may have uploaded an image for a post that is not saved yet. Returns
+    the removed blobs.
+    """
+    referenced = referenced_static_paths()
+    cutoff = datetime.utcnow() - grace
+    unreferenced = [
+        blob
+        for blob in db.session.execute(select(UploadBlob).where(UploadBlob.last_used_at < cutoff)).scalars()
+        if blob.path not in referenced
+    ]
+    if dry_run:
+        return unreferenced
+
+    for blob in unreferenced:
+        path = os.path.join(current_app.static_folder, blob.path)
+        for doomed in [path, *_variant_files(path)]:
+            try:
+                os.remove(doomed)
+            except FileNotFoundError:
+                pass
+        db.session.delete(blob)
+        logger.info("Removed unreferenced upload %s", blob.path)
+    db.session.commit()
+    return unreferenced
+
+
+def _variant_files(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    directory = os.path.dirname(path)
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return [
+        os.path.join(directory, name)
+        for name in names
+        if name == os.path.basename(path) + SIDECAR_SUFFIX or re.fullmatch(rf"{re.escape(stem)}-\d+w\.\w+", name)
+    ]
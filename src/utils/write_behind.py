@@ -0,0 +1,264 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from src.models.database import db
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundFlusher:
+    """
+    Base class for per-process buffers drained by a daemon thread.
+
+    Subclasses implement ``_drain()``; it runs inside the Flask app context every
+    ``interval`` seconds, when ``wake()`` is called, and once more at shutdown.
+    The thread is started lazily on first use so gunicorn's ``--preload`` fork
+    gives every worker its own flusher.
+    """
+
+    def __init__(self, name, interval=5.0):
+        self.name = name
+        self.interval = interval
+        self.app = None
+        self._pid = None
+        self._thread = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._start_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def init_app(self, app):
+        self.app = app
+        atexit.register(self.shutdown)
+
+    def wake(self):
+        self._wakeup.set()
+
+    def ensure_started(self):
+        if self._running():
+            return
+        with self._start_lock:
+            if self._running():
+                return
+            if self._pid != os.getpid():
+                # Inherited across fork: the parent's thread and lock state are gone.
+                self._wakeup = threading.Event()
+                self._flush_lock = threading.Lock()
+                self._reset_after_fork()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-flusher", daemon=True)
+            self._thread.start()
+
+    def _running(self):
+        return self._pid == os.getpid() and self._thread is not None and self._thread.is_alive()
+
+    def _reset_after_fork(self):
+        pass
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        if self.app is None:
+            return
+        with self._flush_lock:
+            with self.app.app_context():
+                try:
+                    self._drain()
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("%s flush failed", self.name)
+
+    def shutdown(self):
+        if self._pid != os.getpid():
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+        self.flush()
+
+    def _drain(self):
+        raise NotImplementedError
+
+
+class WriteBehindQueue(BackgroundFlusher):
+    """
+    Bounded in-process queue of rows that are bulk-inserted in batches.
+
+    Rows are submitted as plain dicts keyed by column name. Batches that cannot be
+    written (database unreachable) are appended to a local JSONL spool file and
+    replayed after the next successful flush. Callbacks registered with
+    ``on_commit()`` see each table's rows once their batch has committed.
+    """
+
+    def __init__(self, name, config_prefix, interval=5.0, batch_size=500, maxsize=10000, spool_path=None):
+        super().__init__(name, interval=interval)
+        self.config_prefix = config_prefix
+        self.batch_size = batch_size
+        self.maxsize = maxsize
+        self.spool_path = spool_path
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._commit_callbacks = []
+
+    def init_app(self, app):
+        prefix = self.config_prefix
+        self.interval = float(app.config.get(f"{prefix}_FLUSH_INTERVAL", self.interval))
+        self.batch_size = int(app.config.get(f"{prefix}_BATCH_SIZE", self.batch_size))
+        self.maxsize = int(app.config.get(f"{prefix}_QUEUE_SIZE", self.maxsize))
+        self.spool_path = app.config.get(f"{prefix}_SPOOL_PATH", self.spool_path)
+        self._queue = queue.Queue(maxsize=self.maxsize)
+        super().init_app(app)
+
+    def _reset_after_fork(self):
+        self._queue = queue.Queue(maxsize=self.maxsize)
+
+    def submit(self, model, row):
+        """Queue ``row`` for insertion into ``model``'s table. Never blocks."""
+        self.ensure_started()
+        table = model.__table__
+        try:
+            self._queue.put_nowait((table.name, _fit_row(table, row)))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning("%s queue full, dropped %s rows so far", self.name, self.dropped)
+            self.wake()
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self.wake()
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def on_commit(self, callback):
+        """Call ``callback(table_name, rows)`` after each batch holding rows for that table commits."""
+        self._commit_callbacks.append(callback)
+
+    def _drain(self):
+        wrote = False
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                break
+            try:
+                self._write(batch)
+                wrote = True
+            except (OperationalError, InterfaceError):
+                self._spool(batch)
+            except Exception:
+                logger.exception("%s discarded %s unwritable rows", self.name, len(batch))
+        if wrote:
+            self._replay_spool()
+
+    def _take_batch(self):
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        groups = defaultdict(list)
+        for table_name, row in batch:
+            groups[(table_name, tuple(sorted(row)))].append(row)
+        try:
+            for (table_name, _), rows in groups.items():
+                db.session.execute(insert(db.metadata.tables[table_name]), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        for (table_name, _), rows in groups.items():
+            for callback in self._commit_callbacks:
+                try:
+                    callback(table_name, rows)
+                except Exception:
+                    # The rows are stored; a failing callback must not get them spooled again.
+                    logger.exception("%s commit callback failed", self.name)
+
+    def _spool(self, batch):
+        if not self.spool_path:
+            logger.error("%s has no spool path, discarding %s rows", self.name, len(batch))
+            return
+        lines = "".join(
+            json.dumps({"table": table_name, "row": row}, default=_encode_value) + "\n"
+            for table_name, row in batch
+        )
+        os.makedirs(os.path.dirname(self.spool_path) or ".", exist_ok=True)
+        with open(self.spool_path, "a", encoding="utf-8") as handle:
+            handle.write(lines)
+        logger.warning("%s spooled %s rows to %s", self.name, len(batch), self.spool_path)
+
+    def _replay_spool(self):
+        if not self.spool_path or not os.path.exists(self.spool_path):
+            return
+        # Claim the spool atomically so only one worker replays it.
+        claimed = f"{self.spool_path}.{os.getpid()}"
+        try:
+            os.replace(self.spool_path, claimed)
+        except FileNotFoundError:
+            return
+
+        with open(claimed, encoding="utf-8") as handle:
+            entries = [json.loads(line) for line in handle if line.strip()]
+
+        for start in range(0, len(entries), self.batch_size):
+            chunk = [
+                (entry["table"], _decode_row(entry["table"], entry["row"]))
+                for entry in entries[start:start + self.batch_size]
+            ]
+            try:
+                self._write(chunk)
+            except (OperationalError, InterfaceError):
+                self._spool([(entry["table"], entry["row"]) for entry in entries[start:]])
+                break
+            except Exception:
+                logger.exception("%s discarded %s unwritable spooled rows", self.name, len(chunk))
+        else:
+            logger.info("%s replayed %s spooled rows", self.name, len(entries))
+        os.remove(claimed)
+
+
+def _fit_row(table, row):
+    """Truncate strings to their column length so one long value cannot fail a batch."""
+    fitted = dict(row)
+    for key, value in row.items():
+        length = getattr(table.c[key].type, "length", None)
+        if length and isinstance(value, str) and len(value) > length:
+            fitted[key] = value[:length]
+    return fitted
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot spool value of type {type(value).__name__}")
+
+
+def _decode_row(table_name, row):
+    table = db.metadata.tables[table_name]
+    decoded = dict(row)
+    for key, value in row.items():
+        if isinstance(value, str) and isinstance(table.c[key].type, db.DateTime):
+            decoded[key] = datetime.fromisoformat(value)
+    return decoded
+
+
+# Shared pipeline for visitor/analytics rows written off the request path.
+analytics_writer = WriteBehindQueue("analytics", config_prefix="ANALYTICS")
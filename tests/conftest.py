@@ -0,0 +1,36 @@
+import pytest
+from flask import Flask
+
+from src.models.database import db, Post, User
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def author(app):
+    user = User(name="Ann Admin", email="ann@example.com", role="admin")
+    user.set_password("secret")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def make_post(author):
+    def make_post(title, **values):
+        post = Post(title=title, content="<p>body</p>", author_id=author.id, **values)
+        db.session.add(post)
+        db.session.commit()
+        return post
+
+    return make_post
@@ -0,0 +1,60 @@
+import io
+
+import pytest
+
+from src.models.database import VisitorLog
+from src.route.website_route.home import home_bp
+from src.utils.event_collector import MAX_BODY_BYTES
+from src.utils.write_behind import analytics_writer
+
+
+@pytest.fixture
+def client(app):
+    app.register_blueprint(home_bp)
+    return app.test_client()
+
+
+def test_collect_accepts_small_batches(client):
+    assert client.post("/collect", data="[]", content_type="application/json").status_code == 204
+
+
+def test_collect_rejects_oversized_body_before_reading(client):
+    body = "[" + " " * MAX_BODY_BYTES + "]"
+
+    assert client.post("/collect", data=body, content_type="application/json").status_code == 413
+
+
+def test_collect_rejects_body_without_length(client):
+    response = client.post(
+        "/collect",
+        input_stream=io.BytesIO(b"[]"),
+        content_type="application/json",
+        headers={"Transfer-Encoding": "chunked"},
+    )
+
+    assert response.status_code == 413
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    rows = []
+    monkeypatch.setattr(analytics_writer, "submit", lambda model, row: rows.append((model, row)))
+    return rows
+
+
+PAGEVIEW = '[{"type": "pageview", "path": "/pricing"}]'
+
+
+def test_pageviews_are_dropped_when_the_server_logs_visits(app, client, submitted):
+    app.config["VISITOR_LOG_SOURCE"] = "server"
+
+    assert client.post("/collect", data=PAGEVIEW, content_type="application/json").status_code == 204
+    assert submitted == []
+
+
+def test_pageviews_are_logged_when_the_client_is_the_source(app, client, submitted):
+    app.config["VISITOR_LOG_SOURCE"] = "client"
+
+    client.post("/collect", data=PAGEVIEW, content_type="application/json")
+
+    assert [(model, row["path"]) for model, row in submitted] == [(VisitorLog, "/pricing")]
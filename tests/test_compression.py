@@ -0,0 +1,60 @@
+import gzip
+
+import brotli
+import pytest
+from flask import Flask, Response, stream_with_context
+
+from src.utils.compression import init_compression, precompress_static
+
+BODY = "<p>" + "compressible " * 200 + "</p>"
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+
+    @app.route("/page")
+    def page():
+        return BODY
+
+    @app.route("/stream")
+    def stream():
+        return Response(stream_with_context(iter([BODY, BODY])), mimetype="text/plain")
+
+    init_compression(app)
+    return app.test_client()
+
+
+def test_brotli_preferred_when_accepted(client):
+    response = client.get("/page", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert brotli.decompress(response.data).decode() == BODY
+
+
+def test_gzip_when_brotli_not_accepted(client):
+    response = client.get("/page", headers={"Accept-Encoding": "gzip, br;q=0"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data).decode() == BODY
+
+
+def test_streamed_response_is_brotli_encoded(client):
+    response = client.get("/stream", headers={"Accept-Encoding": "br"})
+
+    assert "Content-Length" not in response.headers
+    assert brotli.decompress(response.data).decode() == BODY * 2
+
+
+def test_precompress_static_writes_gzip_and_brotli_siblings(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text(BODY)
+    (tmp_path / "tiny.js").write_text("x")
+
+    assert precompress_static(str(tmp_path)) == 2
+    assert gzip.decompress((tmp_path / "css" / "site.css.gz").read_bytes()).decode() == BODY
+    assert brotli.decompress((tmp_path / "css" / "site.css.br").read_bytes()).decode() == BODY
+    assert not (tmp_path / "tiny.js.gz").exists()
+    # Up-to-date siblings are left alone.
+    assert precompress_static(str(tmp_path)) == 0
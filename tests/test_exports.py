@@ -0,0 +1,13 @@
+import pytest
+
+from src.utils.exports import _cell
+
+
+@pytest.mark.parametrize("value", ["+31 6 1234 5678", "+1 (555) 010-9999"])
+def test_phone_numbers_are_not_escaped(value):
+    assert _cell(value) == value
+
+
+@pytest.mark.parametrize("value", ["=1+1", "@SUM(A1)", "-2+3", "+cmd|' /C calc'!A0", "+1+cmd"])
+def test_formulas_are_escaped(value):
+    assert _cell(value) == "'" + value
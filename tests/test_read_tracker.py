@@ -0,0 +1,15 @@
+from src.utils.read_tracker import ReadHeartbeatBuffer
+
+
+def test_new_views_are_dropped_once_the_buffer_is_full(app):
+    buffer = ReadHeartbeatBuffer(interval=60, max_pending=2)
+    buffer.record("post", 1, read_duration=5)
+    buffer.record("post", 2, read_duration=5)
+
+    buffer.record("post", 3, read_duration=5)
+    # Views already buffered keep coalescing.
+    buffer.record("post", 1, read_duration=9)
+
+    assert set(buffer._pending) == {1, 2}
+    assert buffer._pending[1]["b_read_duration"] == 9
+    assert buffer.dropped == 1
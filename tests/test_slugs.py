@@ -0,0 +1,60 @@
+from src.models.database import db, Post
+from src.utils import slugs
+from src.utils.slugs import allocate_slug, flush_with_unique_slug
+
+
+def test_allocate_slug_picks_first_free_suffix(make_post):
+    make_post("Hello")
+    make_post("Hello 3").slug = "hello-3"
+    db.session.commit()
+
+    assert allocate_slug(Post, "hello") == "hello-2"
+    assert allocate_slug(Post, "other") == "other"
+
+
+def test_allocate_slug_ignores_the_row_being_renamed(make_post):
+    post = make_post("Hello")
+
+    assert allocate_slug(Post, "hello", exclude_id=post.id) == "hello"
+
+
+def test_rename_retries_in_savepoint_after_collision(make_post, monkeypatch):
+    make_post("Taken")
+    post = make_post("Original")
+
+    # Simulate a concurrent writer claiming "taken" between lookup and UPDATE.
+    real_allocate = slugs.allocate_slug
+    calls = []
+
+    def racing_allocate(model, base_slug, exclude_id=None):
+        calls.append(base_slug)
+        return "taken" if len(calls) == 1 else real_allocate(model, base_slug, exclude_id)
+
+    monkeypatch.setattr(slugs, "allocate_slug", racing_allocate)
+
+    post.title = "Taken"
+    post.subtitle = "kept across the retry"
+    assert flush_with_unique_slug(post, "taken") == "taken-2"
+    db.session.commit()
+
+    db.session.expire_all()
+    renamed = db.session.get(Post, post.id)
+    assert (renamed.slug, renamed.title, renamed.subtitle) == ("taken-2", "Taken", "kept across the retry")
+    assert len(calls) == 2
+
+
+def test_new_post_retries_after_collision(make_post, author, monkeypatch):
+    make_post("Taken")
+    real_allocate = slugs.allocate_slug
+    calls = []
+
+    def racing_allocate(model, base_slug, exclude_id=None):
+        calls.append(base_slug)
+        return "taken" if len(calls) == 1 else real_allocate(model, base_slug, exclude_id)
+
+    monkeypatch.setattr(slugs, "allocate_slug", racing_allocate)
+
+    post = Post(title="Taken", content="<p>body</p>", author_id=author.id)
+    assert flush_with_unique_slug(post, "taken") == "taken-2"
+    db.session.commit()
+    assert db.session.get(Post, post.id).slug == "taken-2"
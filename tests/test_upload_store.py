@@ -0,0 +1,53 @@
+import io
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from src.models.database import db, UploadBlob
+from src.utils.upload_store import collect_garbage, store_upload
+
+
+@pytest.fixture
+def upload_folder(app, tmp_path):
+    app.static_folder = str(tmp_path / "static")
+    return os.path.join(app.static_folder, "uploads")
+
+
+def _upload(folder, data=b"same bytes"):
+    return store_upload(FileStorage(io.BytesIO(data), filename="a.txt"), folder, ".txt", max_bytes=1024)
+
+
+def _age(days):
+    then = datetime.utcnow() - timedelta(days=days)
+    db.session.execute(db.update(UploadBlob).values(created_at=then, last_used_at=then))
+    db.session.commit()
+
+
+def test_dedup_hit_refreshes_last_used_at(upload_folder):
+    url = _upload(upload_folder)
+    _age(3)
+
+    assert _upload(upload_folder) == url
+    blob = db.session.execute(db.select(UploadBlob)).scalar_one()
+    assert datetime.utcnow() - blob.last_used_at < timedelta(minutes=1)
+
+
+def test_garbage_collection_keeps_recently_reused_blobs(upload_folder):
+    _upload(upload_folder)
+    _age(3)
+    _upload(upload_folder)
+
+    assert collect_garbage(grace=timedelta(days=1)) == []
+    assert db.session.execute(db.select(UploadBlob)).scalar_one()
+
+
+def test_garbage_collection_removes_stale_unreferenced_blobs(app, upload_folder):
+    url = _upload(upload_folder)
+    _age(3)
+
+    removed = collect_garbage(grace=timedelta(days=1))
+
+    assert [blob.path for blob in removed] == [url.removeprefix("/static/")]
+    assert not os.path.exists(os.path.join(app.static_folder, removed[0].path))
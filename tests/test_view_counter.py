@@ -0,0 +1,34 @@
+import pytest
+
+from src.models.database import db
+from src.utils.view_counter import ViewCounter
+
+
+@pytest.fixture
+def counter(app):
+    counter = ViewCounter(interval=60)
+    counter.init_app(app)
+    yield counter
+    counter.shutdown()
+
+
+def test_live_count_adds_unflushed_deltas(counter, make_post):
+    post = make_post("Counted", view_count=5)
+
+    counter.increment(post.id)
+    counter.increment(post.id, 2)
+    assert counter.pending(post.id) == 3
+    assert counter.live_count(post.id, post.view_count) == 8
+    assert counter.live_count(post.id + 1, None) == 0
+
+
+def test_flush_applies_deltas_and_keeps_live_count_stable(counter, make_post):
+    post = make_post("Counted", view_count=5)
+    counter.increment(post.id, 3)
+
+    counter.flush()
+    db.session.expire_all()
+
+    assert post.view_count == 8
+    assert counter.pending(post.id) == 0
+    assert counter.live_count(post.id, post.view_count) == 8